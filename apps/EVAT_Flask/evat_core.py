@@ -1,10 +1,10 @@
 # In[1]:
 
 from __future__ import annotations
-import os, json, time, random, re, math, urllib.request, urllib.parse, json as _j
+import os, json, time, re, math
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 # ================== CONFIG / PATHS ==================
 USER_ID   = "cli_user"
@@ -71,7 +71,7 @@ def extract_poi(text: str) -> Optional[str]:
         if best: return best
     m = re.search(r"(?:\bto\b|\bnear\b|\bat\b|\bin\b|\bfrom\b|\baround\b)\s+(.+)$", text, re.I)
     if m:
-        cand = _clean(re.split(r"[?.,;]", m.group(1))[0])
+        cand = _clean(re.split(r"[?.,;]", m.group(1), maxsplit=1)[0])
         if cand: return cand
     run = []
     for t in (t.strip(",.?!") for t in text.split()):
@@ -79,6 +79,18 @@ def extract_poi(text: str) -> Optional[str]:
         elif run: break
     return " ".join(run) if run else None
 
+# ================== HTTP ==================
+import requests
+# Shared keep-alive session: OCM paging, Nominatim retries and Overpass reuse pooled connections
+_HTTP = requests.Session()
+_HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_UA = {"User-Agent": "EVAT-Chatbot/1.0"}
+try:
+    import orjson
+    def _json(r) -> Any: return orjson.loads(r.content)
+except ImportError:
+    def _json(r) -> Any: return r.json()
+
 # ================== Geocoding ==================
 _GOOGLE = None
 if GOOGLE_API_KEY:
@@ -101,23 +113,31 @@ def geocode_google(q: str) -> Optional[Tuple[float,float]]:
 
 def geocode_osm(q: str) -> Optional[Tuple[float,float]]:
     try:
-        params = urllib.parse.urlencode({"q": q, "format": "json", "limit": 1})
-        url = f"https://nominatim.openstreetmap.org/search?{params}"
-        req = urllib.request.Request(url, headers={"User-Agent": "EVAT-Chatbot/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as r:
-            data = _j.loads(r.read().decode("utf-8"))
+        r = _HTTP.get("https://nominatim.openstreetmap.org/search",
+                      params={"q": q, "format": "json", "limit": 1}, headers=_UA, timeout=10)
+        data = _json(r)
         if data: return float(data[0]["lat"]), float(data[0]["lon"])
     except Exception:
         return None
     return None
 
+_GEOCODE_CACHE: Dict[str, Tuple[float,float]] = {}
+_GEOCODE_CACHE_MAX = 4096
+
 def geocode_australia(poi: str) -> Optional[Tuple[float,float]]:
+    # successful lookups are cached by normalized text; misses are retried next time
+    key = " ".join(poi.split()).casefold()
+    hit = _GEOCODE_CACHE.get(key)
+    if hit: return hit
     tries = [poi, f"{poi}, Australia"]
     parts = poi.split()
     if len(parts) >= 2: tries.append(f"{' '.join(parts[-2:])}, Australia")
     for q in tries:
         c = geocode_google(q) or geocode_osm(q)
-        if c and in_australia(*c): return c
+        if c and in_australia(*c):
+            if len(_GEOCODE_CACHE) >= _GEOCODE_CACHE_MAX: _GEOCODE_CACHE.clear()
+            _GEOCODE_CACHE[key] = c
+            return c
     return None
 
 # ================== Distance ==================
@@ -148,6 +168,14 @@ class UserHistory:
     recent_pois: List[Tuple[str,float]] = field(default_factory=list)
     recent_stations: List[Tuple[str,float]] = field(default_factory=list)
 
+HISTORY_MAX = 50
+
+def _remember(items: List[Tuple[str,float]], *names: str) -> None:
+    # append and trim in place; lists (not deques) so asdict/JSON persistence keeps working
+    now = time.time()
+    items.extend((n, now) for n in names)
+    del items[:-HISTORY_MAX]
+
 @dataclass
 class UserProfile:
     user_id: str
@@ -170,7 +198,7 @@ def reset_profile(uid: str) -> None:
     if p.exists(): p.unlink()
 
 # ================== Dataset (Open Charge Map AU) ==================
-import pandas as pd, requests
+import numpy as np, pandas as pd, requests
 
 def fetch_ocm_australia(basic_csv: Path=BASIC_CSV, enriched_csv: Path=ENRICHED_CSV) -> bool:
     """
@@ -194,9 +222,9 @@ def fetch_ocm_australia(basic_csv: Path=BASIC_CSV, enriched_csv: Path=ENRICHED_C
                 "compact": True,
                 "verbose": False,
             }
-            r = requests.get(url, params=params, headers=headers, timeout=180)
+            r = _HTTP.get(url, params=params, headers=headers, timeout=180)
             r.raise_for_status()
-            all_items: List[Dict[str, Any]] = r.json() or []
+            all_items: List[Dict[str, Any]] = _json(r) or []
             print(f"  · one-shot received {len(all_items)} items")
         else:
             # ID-cursor pagination
@@ -216,9 +244,9 @@ def fetch_ocm_australia(basic_csv: Path=BASIC_CSV, enriched_csv: Path=ENRICHED_C
                     "sortby": "id_asc",
                     "greaterthanid": last_id
                 }
-                r = requests.get(url, params=params, headers=headers, timeout=90)
+                r = _HTTP.get(url, params=params, headers=headers, timeout=90)
                 r.raise_for_status()
-                items = r.json() or []
+                items = _json(r) or []
 
                 # strictly-new IDs beyond the last cursor
                 new = [it for it in items if isinstance(it.get("ID"), int) and it["ID"] > last_id]
@@ -299,16 +327,13 @@ def fetch_ocm_australia(basic_csv: Path=BASIC_CSV, enriched_csv: Path=ENRICHED_C
     return True
 
 def _synthetic_au(n: int = 500) -> List[Dict[str,Any]]:
-    random.seed(42)
-    seeds = [(-33.87,151.21),(-37.81,144.96),(-27.47,153.03),(-31.95,115.86),
-             (-34.93,138.60),(-35.28,149.13),(-42.88,147.33),(-12.46,130.84)]
-    out=[]
-    for i in range(1, n+1):
-        lat0, lon0 = random.choice(seeds)
-        out.append({"name": f"EV Station {i}",
-                    "latitude": lat0 + random.uniform(-0.3, 0.3),
-                    "longitude": lon0 + random.uniform(-0.3, 0.3)})
-    return out
+    seeds = np.array([(-33.87,151.21),(-37.81,144.96),(-27.47,153.03),(-31.95,115.86),
+                      (-34.93,138.60),(-35.28,149.13),(-42.88,147.33),(-12.46,130.84)])
+    # sample every seed index and jitter in one batch instead of per-row random calls
+    rng = np.random.default_rng(42)
+    coords = seeds[rng.integers(len(seeds), size=n)] + rng.uniform(-0.3, 0.3, size=(n, 2))
+    return [{"name": f"EV Station {i}", "latitude": float(lat), "longitude": float(lon)}
+            for i, (lat, lon) in enumerate(coords.tolist(), start=1)]
 
 def ensure_dataset() -> None:
     if REFRESH_DATA or not BASIC_CSV.exists():
@@ -397,9 +422,8 @@ def route_osrm(origin: Tuple[float,float], dest: Tuple[float,float]) -> Optional
     try:
         o = f"{origin[1]},{origin[0]}"; d = f"{dest[1]},{dest[0]}"
         url = f"https://router.project-osrm.org/route/v1/driving/{o};{d}?overview=full&geometries=geojson"
-        req = urllib.request.Request(url, headers={"User-Agent": "EVAT-Chatbot/1.0"})
-        with urllib.request.urlopen(req, timeout=20) as r:
-            data = _j.loads(r.read().decode("utf-8"))
+        r = _HTTP.get(url, headers=_UA, timeout=20)
+        data = _json(r)
         if data.get("code") == "Ok" and data.get("routes"):
             route = data["routes"][0]
             coords = route["geometry"]["coordinates"]
@@ -475,6 +499,14 @@ def plan_trip_with_chargers(origin: Tuple[float,float], dest: Tuple[float,float]
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
 TOURISM_TAGS = ["attraction","museum","gallery","viewpoint","zoo","theme_park","artwork","monument","memorial","park","beach"]
 
+class Landmark(NamedTuple):
+    name: str
+    type: str
+    latitude: float
+    longitude: float
+    distance_km: float
+    pref_hit: bool
+
 def find_sightseeing_near(pt: Tuple[float,float], prefs: UserPreferences, radius_km: float=3.0, max_items: int=3) -> List[Dict[str,Any]]:
     lat, lon = pt
     radius_m = int(radius_km * 1000)
@@ -486,35 +518,33 @@ def find_sightseeing_near(pt: Tuple[float,float], prefs: UserPreferences, radius
     q = f"[out:json][timeout:25];({''.join(parts)});out center 20;"
 
     try:
-        r = requests.post(OVERPASS_URL, data={"data": q}, timeout=30)
+        r = _HTTP.post(OVERPASS_URL, data={"data": q}, timeout=30)
         r.raise_for_status()
-        data = r.json().get("elements", [])
+        data = _json(r).get("elements", [])
     except Exception:
         return []
 
-    out = []
+    prefs_kw = [p.lower() for p in (prefs.sightseeing_prefs or [])]
+    out: List[Landmark] = []
     for el in data:
-        tags = el.get("tags", {})
-        name = tags.get("name") or tags.get("ref") or "Attraction"
+        tags = el.get("tags") or {}
         if "lat" in el and "lon" in el:
             alat, alon = el["lat"], el["lon"]
         else:
-            c = el.get("center", {})
+            c = el.get("center") or {}
             alat, alon = c.get("lat"), c.get("lon")
         if alat is None or alon is None: continue
 
-        dist = round(distance_km(pt, (alat, alon)), 2)
+        name = tags.get("name") or tags.get("ref") or "Attraction"
         label = tags.get("tourism") or tags.get("amenity") or "poi"
-        out.append({"name": name, "type": label, "latitude": alat, "longitude": alon, "distance_km": dist})
-
-    prefs_kw = [p.lower() for p in (prefs.sightseeing_prefs or [])]
-    def score(p):
-        txt = (p["name"] + " " + p["type"]).lower()
+        txt = (name + " " + label).lower()
         pref_hit = any(k in txt for k in prefs_kw) if prefs_kw else False
-        return (1 if pref_hit else 0, -1.0/p["distance_km"] if p["distance_km"]>0 else 0)
+        out.append(Landmark(name, label, alat, alon, round(distance_km(pt, (alat, alon)), 2), pref_hit))
 
-    out.sort(key=score, reverse=True)
-    return out[:max_items]
+    out.sort(key=lambda p: (1 if p.pref_hit else 0, -1.0/p.distance_km if p.distance_km>0 else 0), reverse=True)
+    # only the returned few become dicts
+    return [{"name": p.name, "type": p.type, "latitude": p.latitude, "longitude": p.longitude,
+             "distance_km": p.distance_km} for p in out[:max_items]]
 
 # --------- Dual plan (shortest vs enhanced) ----------
 def plan_dual_routes(origin: Tuple[float,float], dest: Tuple[float,float], profile: UserProfile, stations: List[Dict[str,Any]]) -> Optional[Dict[str,Any]]:
@@ -659,8 +689,7 @@ def main():
                     print("Bot: Sorry, routing failed. Try again."); print(); continue
                 print_dual_trip(plans)
                 if profile.prefs.consent:
-                    profile.history.recent_pois += [(trip.origin_text, time.time()), (trip.dest_text, time.time())]
-                    profile.history.recent_pois = profile.history.recent_pois[-50:]; save_profile(profile)
+                    _remember(profile.history.recent_pois, trip.origin_text, trip.dest_text); save_profile(profile)
                 trip = TripState()
                 continue
 
@@ -673,13 +702,11 @@ def main():
             print_nearby(user_msg, poi, None, []); print(); continue
 
         if profile.prefs.consent:
-            profile.history.recent_pois.append((poi, time.time()))
-            profile.history.recent_pois = profile.history.recent_pois[-50:]; save_profile(profile)
+            _remember(profile.history.recent_pois, poi); save_profile(profile)
 
         top3 = personalize_rank(coords, profile, stations, want_k=3)
         if top3 and profile.prefs.consent:
-            profile.history.recent_stations.append((top3[0]["name"], time.time()))
-            profile.history.recent_stations = profile.history.recent_stations[-50:]; save_profile(profile)
+            _remember(profile.history.recent_stations, top3[0]["name"]); save_profile(profile)
 
         print_nearby(user_msg, poi, coords, top3); print()
 
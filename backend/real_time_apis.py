@@ -1,11 +1,32 @@
 import os
 import json
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 
 import requests
 import datetime
+import random
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _station_cache: Dict[str, Dict[str, Any]] = {}
+STATION_CACHE_TTL_SECONDS = 600
+ROUTE_COALESCE_SECONDS = 30
+ROUTE_CACHE_MAX_ENTRIES = 256
+
+# Transient TomTom failures worth retrying before falling back
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_ATTEMPTS = 3
+BACKOFF_SECONDS = 0.2
+MAX_BACKOFF_SECONDS = 2.0
+# Sync Rasa actions call TomTom on the action server's event loop, so keep the total wait short
+MAX_TOTAL_BACKOFF_SECONDS = 1.0
 try:
     from dotenv import load_dotenv
 
@@ -21,27 +42,131 @@ except Exception:
     pass
 
 
+class RouteInfo(TypedDict):
+    source: str
+    distance_km: float
+    duration_minutes: float
+    traffic_delay_minutes: float
+    instructions: List[str]
+    polyline: Optional[List[Tuple[float, float]]]
+
+
+class TrafficInfo(TypedDict):
+    source: str
+    traffic_status: str
+    congestion_level: Optional[int]
+    current_speed_kmh: Optional[float]
+    free_flow_speed_kmh: Optional[float]
+    estimated_delay_minutes: float
+
+
+class StationAvailability(TypedDict):
+    available: Optional[bool]
+    updated_at: Optional[str]
+    data: Any
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ApiManager:
 
+    # (epoch second, ISO string) for the last formatted timestamp; replaced whole, never mutated
+    _iso_cache: Tuple[int, str] = (0, '')
+
     def __init__(self, api_key: Optional[str] = None, timeout_seconds: int = 15) -> None:
         self.api_key = api_key or os.environ.get('TOMTOM_API_KEY') or ''
         self.timeout_seconds = timeout_seconds
         self.base_url = 'https://api.tomtom.com'
+        # Oldest entry first; shared by the preference search's worker threads, so guarded by a lock
+        self._route_cache: 'OrderedDict[Tuple[float, float, float, float], Tuple[float, RouteInfo]]' = OrderedDict()
+        self._route_cache_lock = threading.Lock()
+        # One keep-alive session so repeated calls reuse the TLS connection to api.tomtom.com
+        self._session = requests.Session()
+        self._session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=10))
 
     def _has_key(self) -> bool:
         return isinstance(self.api_key, str) and len(self.api_key.strip()) > 0
 
-    def get_real_time_route(self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def _now_iso(cls) -> str:
+        """Return the current UTC time as ISO text, formatted at most once per second."""
+        t = int(time.time())
+        cached_t, iso = cls._iso_cache
+        if cached_t != t:
+            iso = datetime.datetime.fromtimestamp(t, datetime.timezone.utc).replace(tzinfo=None).isoformat()
+            cls._iso_cache = (t, iso)
+        return iso
+
+    def _tomtom_get(self, path: str, params: Dict[str, Any], api_key: Optional[str] = None,
+                    timeout: Optional[float] = None) -> Any:
+        """GET a TomTom endpoint and return the decoded JSON body.
+
+        Rate-limit and gateway errors are retried with jittered exponential
+        backoff (honouring Retry-After) within MAX_TOTAL_BACKOFF_SECONDS;
+        anything else raises immediately and callers decide the fallback.
+        """
+        url = f"{self.base_url}{path}"
+        params = {**params, 'key': api_key or self.api_key}
+        budget = MAX_TOTAL_BACKOFF_SECONDS
+        for attempt in range(MAX_ATTEMPTS):
+            resp = self._session.get(url, params=params,
+                                     timeout=timeout or self.timeout_seconds)
+            if resp.status_code not in RETRY_STATUS_CODES or attempt == MAX_ATTEMPTS - 1:
+                break
+            delay = min(MAX_BACKOFF_SECONDS, BACKOFF_SECONDS * (2 ** attempt))
+            retry_after = resp.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(MAX_BACKOFF_SECONDS, float(retry_after))
+            pause = min(delay + random.uniform(0, delay / 2), budget)
+            if pause <= 0:
+                break
+            time.sleep(pause)
+            budget -= pause
+        resp.raise_for_status()
+        return _loads(resp.content)
+
+    def get_real_time_route(self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]) -> Optional[RouteInfo]:
         """Return route with traffic-aware summary.
         Coords are (lat, lon).
+
+        Requests for the same ~10 m start/end cells within ROUTE_COALESCE_SECONDS
+        share one TomTom call (route + traffic lookups for a single user turn
+        otherwise fetch the same route several times).
         """
         if not self._has_key():
             return None
+        try:
+            key = (round(float(start_coords[0]), 4), round(float(start_coords[1]), 4),
+                   round(float(end_coords[0]), 4), round(float(end_coords[1]), 4))
+        except (TypeError, ValueError, IndexError):
+            return None
+        with self._route_cache_lock:
+            hit = self._route_cache.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+        route = self._fetch_real_time_route(start_coords, end_coords)
+        if route:
+            now = time.monotonic()
+            with self._route_cache_lock:
+                cache = self._route_cache
+                cache.pop(key, None)
+                # Entries share one TTL, so the oldest are the expired ones; past the cap evict those too
+                while cache and (len(cache) >= ROUTE_CACHE_MAX_ENTRIES or next(iter(cache.values()))[0] <= now):
+                    cache.popitem(last=False)
+                cache[key] = (now + ROUTE_COALESCE_SECONDS, route)
+        return route
+
+    def _fetch_real_time_route(self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]) -> Optional[RouteInfo]:
         try:
             start_lat, start_lon = start_coords
             end_lat, end_lon = end_coords
             path = f"/routing/1/calculateRoute/{start_lat},{start_lon}:{end_lat},{end_lon}/json"
-            url = f"{self.base_url}{path}"
             params = {
                 'routeType': 'fastest',
                 'traffic': 'true',
@@ -49,12 +174,8 @@ class ApiManager:
                 'instructionsType': 'text',
                 # Request polyline geometry when available
                 'routeRepresentation': 'polyline',
-                'key': self.api_key,
             }
-            resp = requests.get(url, params=params,
-                                timeout=self.timeout_seconds)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._tomtom_get(path, params)
             routes = data.get('routes', [])
             if not routes:
                 return None
@@ -74,27 +195,8 @@ class ApiManager:
                 instructions = []
 
             # Try to extract polyline points if provided
-            polyline: List[Tuple[float, float]] = []
             try:
-                for leg in route.get('legs', []) or []:
-                    # TomTom legs may contain 'points' array with lat/lon
-                    pts = leg.get('points') or []
-                    for p in pts:
-                        lat = p.get('latitude') or p.get('lat')
-                        lon = p.get('longitude') or p.get('lon')
-                        if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
-                            polyline.append((float(lat), float(lon)))
-                    # Some responses may use 'shape' as list of "lat,lon" strings
-                    if not pts:
-                        shape = leg.get('shape') or []
-                        for s in shape:
-                            if isinstance(s, str) and ',' in s:
-                                try:
-                                    lat_str, lon_str = s.split(',', 1)
-                                    polyline.append(
-                                        (float(lat_str), float(lon_str)))
-                                except Exception:
-                                    continue
+                polyline = self._extract_waypoints(route)
             except Exception:
                 polyline = []
 
@@ -109,7 +211,32 @@ class ApiManager:
         except Exception:
             return None
 
-    def get_real_time_traffic(self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _extract_waypoints(route: Dict[str, Any]) -> List[Tuple[float, float]]:
+        """Flatten route legs into a list of (lat, lon) tuples.
+
+        Legs normally carry a 'points' array; legs without one may instead
+        provide 'shape' as a list of "lat,lon" strings.
+        """
+        polyline: List[Tuple[float, float]] = []
+        for leg in route.get('legs', []) or []:
+            pts = leg.get('points') or []
+            if pts:
+                pairs = [(p.get('latitude') or p.get('lat'), p.get('longitude') or p.get('lon'))
+                         for p in pts]
+                polyline.extend([(float(lat), float(lon)) for lat, lon in pairs
+                                 if isinstance(lat, (int, float)) and isinstance(lon, (int, float))])
+                continue
+            for s in leg.get('shape') or []:
+                if isinstance(s, str) and ',' in s:
+                    lat_str, lon_str = s.split(',', 1)
+                    try:
+                        polyline.append((float(lat_str), float(lon_str)))
+                    except ValueError:
+                        continue
+        return polyline
+
+    def get_real_time_traffic(self, start_coords: Tuple[float, float], end_coords: Tuple[float, float]) -> Optional[TrafficInfo]:
         """Return traffic details for a route. Uses route summary as a proxy.
 
         Coords are (lat, lon).
@@ -128,16 +255,12 @@ class ApiManager:
         try:
             mid_lat = (float(start_coords[0]) + float(end_coords[0])) / 2.0
             mid_lon = (float(start_coords[1]) + float(end_coords[1])) / 2.0
-            flow_url = f"{self.base_url}/traffic/services/4/flowSegmentData/absolute/10/json"
             params = {
                 'point': f"{mid_lat},{mid_lon}",
                 'unit': 'KMPH',
-                'key': self.api_key,
             }
-            resp = requests.get(flow_url, params=params,
-                                timeout=self.timeout_seconds)
-            resp.raise_for_status()
-            flow = resp.json()
+            flow = self._tomtom_get(
+                "/traffic/services/4/flowSegmentData/absolute/10/json", params)
             fsd = (flow or {}).get('flowSegmentData') or {}
             cs = fsd.get('currentSpeed')
             ffs = fsd.get('freeFlowSpeed')
@@ -182,19 +305,14 @@ class ApiManager:
             lon = float(y)
             radius = float(radius_km or 15.0)
             try:
-                url = f"{self.base_url}/search/2/nearbySearch/.json"
                 params = {
                     'lat': lat,
                     'lon': lon,
                     'limit': 10,
                     'radius': int(radius * 1000),
                     'categorySet': 7309,  # EV Charging Stations
-                    'key': self.api_key,
                 }
-                resp = requests.get(url, params=params,
-                                    timeout=self.timeout_seconds)
-                resp.raise_for_status()
-                data = resp.json()
+                data = self._tomtom_get("/search/2/nearbySearch/.json", params)
                 results = data.get('results', [])
                 stations: List[Dict[str, Any]] = []
                 for r in results:
@@ -226,7 +344,7 @@ class ApiManager:
     Removed unused geocode.
     """
 
-    def get_charging_availability(self, lat: float, lon: float) -> Dict[str, Any]:
+    def get_charging_availability(self, lat: float, lon: float) -> StationAvailability:
         """
         Get basic availability of a charging station near given coordinates.
 
@@ -242,18 +360,20 @@ class ApiManager:
 
         # --- Cache check ---
         if station_key in _station_cache:
-            if _station_cache[station_key]["expiry"] > datetime.datetime.utcnow():
+            if _station_cache[station_key]["expiry"] > time.monotonic():
                 return _station_cache[station_key]["data"]
 
         try:
             # Step 1: Find nearest EV charging station (categorySet=7309)
-            nearby_url = (
-                f"https://api.tomtom.com/search/2/nearbySearch/.json?"
-                f"lat={lat}&lon={lon}&key={api_key}&radius=500&limit=1&categorySet=7309"
-            )
-            resp1 = requests.get(nearby_url, timeout=5)
-            resp1.raise_for_status()
-            nearby_data = resp1.json()
+            nearby_params = {
+                "lat": lat,
+                "lon": lon,
+                "radius": 500,
+                "limit": 1,
+                "categorySet": 7309,
+            }
+            nearby_data = self._tomtom_get(
+                "/search/2/nearbySearch/.json", nearby_params, api_key=api_key, timeout=5)
 
             if not nearby_data.get("results"):
                 return {"available": None, "updated_at": None, "data": "No station found"}
@@ -262,16 +382,13 @@ class ApiManager:
             # print("Nearest stationId:", station_id)
 
             # Step 2: Get real-time availability
-            avail_url = "https://api.tomtom.com/search/2/chargingAvailability.json"
             params = {
-                "key": api_key,
                 "chargingAvailability": station_id,
                 "minPowerKW": 1,
                 "maxPowerKW": 100,
             }
-            resp2 = requests.get(avail_url, params=params, timeout=5)
-            resp2.raise_for_status()
-            avail_data = resp2.json()
+            avail_data = self._tomtom_get(
+                "/search/2/chargingAvailability.json", params, api_key=api_key, timeout=5)
             # print("Availability response:", avail_data)
 
             # Simplified peek
@@ -284,7 +401,7 @@ class ApiManager:
             if connectors:
                 free_count = sum(c.get("available", 0) for c in connectors)
                 available = free_count > 0
-                updated_at = datetime.datetime.utcnow().isoformat()
+                updated_at = self._now_iso()
 
             result = {"available": available,
                       "updated_at": updated_at, "data": avail_data}
@@ -292,7 +409,7 @@ class ApiManager:
             # --- Cache store (10 min TTL) ---
             _station_cache[station_key] = {
                 "data": result,
-                "expiry": datetime.datetime.utcnow() + datetime.timedelta(minutes=10),
+                "expiry": time.monotonic() + STATION_CACHE_TTL_SECONDS,
             }
             return result
 
@@ -301,4 +418,14 @@ class ApiManager:
 
 
 # Global instance as expected by imports in Rasa actions
-api_manager = ApiManager()
+@lru_cache(maxsize=1)
+def get_api_manager() -> ApiManager:
+    """Return the shared ApiManager, constructing it on first use."""
+    return ApiManager()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from real_time_apis import api_manager` working for older callers
+    if name == 'api_manager':
+        return get_api_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
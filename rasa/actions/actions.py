@@ -1,13 +1,17 @@
 from rasa_sdk import Action, Tracker
 from rasa_sdk.events import SlotSet, FollowupAction
 from rasa_sdk.executor import CollectingDispatcher
+from abc import ABC, abstractmethod
 from typing import Any, Text, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
+import asyncio
+import difflib
 import logging
 import re
 
-from actions.data_service import data_service
-from actions.constants import ConversationContexts, MainMenuOptions, PreferenceTypes, ActionTypes, Messages
+from actions.config import SEARCH_CONFIG
+from actions.data_service import get_data_service
+from actions.constants import ConversationContexts, MainMenuOptions, PreferenceTypes, ActionTypes, Messages, ErrorMessages
 
 # Import real-time integration
 try:
@@ -19,6 +23,174 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every turn, compiled once at import
+_FROM_TO_RE = re.compile(r'^\s*from\s+(.+?)\s+\bto\b\s+(.+?)\s*$', re.IGNORECASE)
+_FROM_TO_ANYWHERE_RE = re.compile(r'from(.*?) to (.*)', re.DOTALL)
+_LEADING_TO_RE = re.compile(r'^\s*to\b', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'^\d+$')
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+_COORD_PAIR_RE = re.compile(r'^\(?\s*-?\d+\.\d+\s*,\s*-?\d+\.\d+\s*\)?$')
+
+# Keyword groups scanned in one pass each instead of one substring search per word
+_THANKS_RE = re.compile(r'thanks|thank you|thx')
+_ROUTE_MENU_RE = re.compile(r'route|trip|journey|plan')
+_EMERGENCY_MENU_RE = re.compile(r'emergency|urgent|battery low|low battery')
+_PREFERENCE_MENU_RE = re.compile(r'preference|cheapest|fastest|premium')
+_COMPARE_CHOICE_RE = re.compile(r'compare|comparison|other|options')
+_AVAILABILITY_CHOICE_RE = re.compile(r'availability|available|status|check')
+# "I'll go with X" style phrasings that ask to commit to a station straight away
+_DECISION_PHRASE_RE = re.compile(
+    r"i go with|i choose|i select|i pick|i would like|i'd like|i will go with|i'll go with|go with|take")
+
+# Connector inference for the emergency flow: direct connector names win over car models,
+# and each bucket is one alternation so a message is scanned once per bucket
+_CCS_CAR_MODELS = (
+    # Hyundai/Kia
+    'ioniq', 'kona', 'ev6', 'e-niro', 'niro', 'ev6', 'soul ev',
+    # MG
+    'mg zs', 'mg 4', 'mg 5', 'mg marvel', 'mg cyberster',
+    # Polestar/Volvo
+    'polestar', 'volvo xc40', 'volvo c40', 'volvo ex30', 'volvo ex90',
+    # BYD
+    'byd', 'atto 3', 'dolphin', 'seal', 'tang', 'han',
+    # Volkswagen Group
+    'id.3', 'id.4', 'id.5', 'id.buzz', 'audi e-tron', 'audi q4', 'porsche taycan',
+    # BMW
+    'bmw i3', 'bmw i4', 'bmw ix', 'bmw i7', 'bmw i5',
+    # Mercedes
+    'eqa', 'eqb', 'eqc', 'eqe', 'eqs', 'mercedes ev',
+    # Ford
+    'mustang mach-e', 'f-150 lightning', 'e-transit',
+    # Chevrolet
+    'bolt', 'bolt euv', 'silverado ev', 'blazer ev',
+    # Other popular EVs
+    'rivian r1t', 'rivian r1s', 'lucid air', 'fisker ocean', 'canoo'
+)
+_CHADEMO_CAR_MODELS = (
+    # Nissan
+    'leaf', 'ariya',
+    # Mitsubishi
+    'outlander phev', 'i-miev',
+    # Kia (older models)
+    'soul ev 2014-2019'
+)
+_TYPE2_CAR_MODELS = (
+    # Tesla (older models in Europe)
+    'tesla model s', 'tesla model x', 'tesla model 3', 'tesla model y',
+    # European EVs
+    'renault zoe', 'peugeot e-208', 'opel corsa-e', 'fiat 500e',
+    # Japanese EVs
+    'toyota bz4x', 'subaru solterra', 'lexus rz'
+)
+_TESLA_CAR_MODELS = (
+    # Tesla (North America/Asia)
+    'tesla model s', 'tesla model x', 'tesla model 3', 'tesla model y',
+    'cybertruck', 'roadster'
+)
+_CONNECTOR_PATTERNS = tuple(
+    (connector, re.compile('|'.join(map(re.escape, keywords))))
+    for connector, keywords in (
+        ('chademo', ('chademo',)),
+        ('ccs', ('ccs2', 'ccs 2', 'ccs')),
+        ('type 2', ('type 2', 'mennekes')),
+        ('tesla', ('tesla',)),
+        ('ccs', _CCS_CAR_MODELS),
+        ('chademo', _CHADEMO_CAR_MODELS),
+        ('type 2', _TYPE2_CAR_MODELS),
+        ('tesla', _TESLA_CAR_MODELS),
+    )
+)
+
+# OpenChargeMap connection-type IDs that appear in the dataset's connection column
+_CONNECTOR_CODES = {
+    'type 2': ('25', '1036'),            # Type 2 (Mennekes)
+    'ccs': ('33', '1', '21', '31'),      # CCS (CCS2 used in AU)
+    'chademo': ('2', '4', '24', '34'),   # CHAdeMO
+    'tesla': ('33', '1036'),             # Superchargers use CCS2 in AU
+}
+
+# Contexts in which each station-selection flow accepts input
+_ROUTE_SELECTION_CONTEXTS = frozenset({
+    ConversationContexts.ROUTE_PLANNING_RESULTS, ConversationContexts.STATION_DETAILS})
+_EMERGENCY_CONTEXTS = frozenset({
+    ConversationContexts.EMERGENCY_CHARGING, ConversationContexts.EMERGENCY_RESULTS})
+_PREFERENCE_CONTEXTS = frozenset({
+    ConversationContexts.PREFERENCE_CHARGING, ConversationContexts.PREFERENCE_RESULTS})
+
+# Station-details follow-ups: numbered choices from Messages.ACTION_CHOICE_PROMPT first, then keywords
+_ACTION_CHOICE_BY_NUMBER = {
+    "2": ActionTypes.COMPARE_OPTIONS,
+    "3": ActionTypes.CHECK_AVAILABILITY,
+}
+_ACTION_CHOICE_PATTERNS = (
+    (ActionTypes.COMPARE_OPTIONS, _COMPARE_CHOICE_RE),
+    (ActionTypes.CHECK_AVAILABILITY, _AVAILABILITY_CHOICE_RE),
+)
+
+# Station-name spelling variants folded together in one pass
+_STATION_NAME_SUBS = {"centre": "center", "&": "and", "-": " "}
+_STATION_NAME_SUB_RE = re.compile(r'centre|&|-')
+
+# Preference keyword stems matched at the start of a word, checked in priority order, so
+# inflections ("cheaper", "costs", "speedy") match but "breakfast" does not
+_PREFERENCE_KEYWORDS = (
+    (PreferenceTypes.CHEAPEST, re.compile(r'\b(?:cheap|lowest|cost|price)')),
+    (PreferenceTypes.FASTEST, re.compile(r'\b(?:fast|speed|quick|ultra)')),
+    (PreferenceTypes.PREMIUM, re.compile(r'\b(?:premium|best|luxur|amenit)')),
+)
+_PREFERENCE_CHOICES = frozenset({'cheapest', 'fastest', 'premium'})
+
+# Station detail body shared by the route, emergency and preference flows
+_STATION_DETAILS_TMPL = (
+    "📍 **Address:** {address}\n"
+    "⚡ **Power:** {power} charging\n"
+    "💰 **Cost:** {cost}\n"
+    "🕐 **Charging time:** {charging_time}\n"
+    "🔌 **Available points:** {points}\n\n"
+    "**🎯 What would you like to do next?**\n\n"
+    "• Type 'get directions' to this station 🧭\n"
+    "• Type 'compare options' 📊\n"
+    "• Type 'check availability' ✅"
+)
+
+
+def _format_station_details(header: str, station: Dict[str, Any]) -> str:
+    return header + _STATION_DETAILS_TMPL.format(
+        address=station.get('address', 'Address available'),
+        power=station.get('power', 'Power info available'),
+        cost=station.get('cost', 'Cost info available'),
+        charging_time=station.get('charging_time', 'Time estimate available'),
+        points=station.get('points', 'Point info available'),
+    )
+
+
+def _displayed_station_names(tracker: Tracker) -> str:
+    """Comma-separated names of the stations last shown, for "please choose one of" replies."""
+    return ", ".join(s.get('name') for s in (tracker.get_slot("displayed_stations") or [])) or "the list above"
+
+
+def _message_text(tracker: Tracker) -> str:
+    """The latest user message, stripped; empty when the channel sent no text."""
+    return (tracker.latest_message.get('text') or '').strip()
+
+
+def _normalized_message(tracker: Tracker) -> str:
+    """The latest user message, stripped and lowercased for keyword matching."""
+    return _message_text(tracker).lower()
+
+
+def _match_preference(message: str) -> Optional[str]:
+    """The charging preference a lowercased message asks for, or None."""
+    return next((pref for pref, pattern in _PREFERENCE_KEYWORDS if pattern.search(message)), None)
+
+
+def _latest_entity(tracker: Tracker, entity: str) -> Any:
+    """Value of the first `entity` extracted from the latest message, or None."""
+    for ent in tracker.latest_message.get("entities") or []:
+        if ent.get("entity") == entity and ent.get("value") is not None:
+            return ent.get("value")
+    return None
+
 
 def format_station_list(stations: List[Dict[str, Any]], limit: int = 5, show_indices: bool = True) -> str:
     lines: List[str] = []
@@ -48,12 +220,7 @@ def extract_from_to_route(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Extract start/end route locations from free text like 'from X to Y'."""
     if not text:
         return None, None
-    import re
-    match = re.search(
-        r'^\s*from\s+(.+?)\s+\bto\b\s+(.+?)\s*$',
-        text.strip(),
-        flags=re.IGNORECASE
-    )
+    match = _FROM_TO_RE.search(text.strip())
     if not match:
         return None, None
     start = match.group(1).strip()
@@ -104,8 +271,7 @@ def _map_station_for_ui(station: Dict[str, Any]) -> Dict[str, Any]:
     if isinstance(p, (int, float)):
         power_val = int(p)
     elif p is not None:
-        import re as _re
-        nums = _re.findall(r"\d+\.?\d*", str(p))
+        nums = _NUMBER_RE.findall(str(p))
         if nums:
             try:
                 power_val = int(float(nums[0]))
@@ -139,6 +305,62 @@ def _map_station_for_ui(station: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _parse_route(message: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split 'from X to Y' anywhere in a lowercased message; both parts or neither."""
+    route_match = _FROM_TO_ANYWHERE_RE.search(message)
+    if not route_match:
+        return None, None
+    start_location = route_match.group(1).strip()
+    end_location = route_match.group(2).strip()
+    if not start_location or not end_location:
+        return None, None
+    return start_location, end_location
+
+
+def _extract_station_name(message: str) -> Optional[str]:
+    """Treat the typed text as a station name once it is long enough to match on."""
+    message = message.strip()
+    if len(message) > 2:
+        return message
+    return None
+
+
+def _find_station_by_name(stations: List[Dict[str, Any]], name: str) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+    """Station named `name` (case-insensitive), else the first whose name contains it, else the
+    closest spelling, with its 1-based position."""
+    needle = name.lower()
+    lower_names = [station.get('name', '').lower() for station in stations]
+    try:
+        i = lower_names.index(needle)
+    except ValueError:
+        i = next((i for i, lower_name in enumerate(lower_names) if needle in lower_name), None)
+        if i is None:
+            # Typos such as "prefrence statoin 1"
+            close = difflib.get_close_matches(
+                needle, lower_names, n=1, cutoff=SEARCH_CONFIG['STATION_NAME_MATCH_CUTOFF'])
+            if not close:
+                return None, None
+            i = lower_names.index(close[0])
+    return stations[i], i + 1
+
+
+def _match_displayed_station(displayed: List[Dict[str, Any]], stations: List[Dict[str, Any]],
+                             message: str) -> Optional[Dict[str, Any]]:
+    """Route station named in a lowercased message, trying the names last shown to the user first."""
+    normalized = [((st.get('name') or '').lower().strip(), st) for st in stations]
+    for shown in displayed:
+        name = (shown.get('name') or '').lower().strip()
+        if name and (name in message or message in name):
+            selected = next((st for st_name, st in normalized if st_name == name), None)
+            if not selected:
+                selected = next((st for st_name, st in normalized if name in st_name), None)
+            if selected:
+                return selected
+    # Fallback: search all stations in current route list
+    return next((st for st_name, st in normalized
+                 if st_name and (st_name in message or message in st_name)), None)
+
+
 def _send_station_cards(dispatcher: CollectingDispatcher, stations: List[Dict[str, Any]], limit: int = 10) -> None:
     """Send stations to frontend in the expected custom payload schema."""
     try:
@@ -151,30 +373,34 @@ def _send_station_cards(dispatcher: CollectingDispatcher, stations: List[Dict[st
             })
     except Exception:
         # Non-fatal if UI payload fails
-        pass
+        logger.debug("Station card payload skipped", exc_info=True)
+
+
+def _announce_route_stations(dispatcher: CollectingDispatcher, stations: List[Dict[str, Any]], start_location, end_location: str) -> None:
+    """Send the station cards plus the 'Found N stations along your route' summary."""
+    start_display = "Your Location" if isinstance(start_location, tuple) else start_location
+    _send_station_cards(dispatcher, stations, limit=10)
+    dispatcher.utter_message(
+        text=f"Found {len(stations)} station{'s' if len(stations) != 1 else ''} along your route "
+             f"from {start_display} to {end_location}. Tap a card or type a station name.")
 
 
 class ActionCollectInitialLocation(Action):
     def name(self) -> Text:
         return "action_collect_initial_location"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
 
         # Check GPS metadata first — the frontend sends it on the initial "hello"
-        user_lat = tracker.latest_message.get('metadata', {}).get('lat')
-        user_lng = tracker.latest_message.get('metadata', {}).get('lng')
+        metadata = tracker.latest_message.get('metadata') or {}
+        user_lat = metadata.get('lat')
+        user_lng = metadata.get('lng')
 
         if not conversation_context and user_lat and user_lng:
             # GPS arrived on the initial hello — skip "please share location" entirely
             dispatcher.utter_message(
-                text="Hello! Welcome to Melbourne EV Charging Assistant! ⚡\n\n"
-                     "✅ **Location detected!** Now I can help you find the best charging options.\n\n"
-                     "Please select an option:\n\n"
-                     "1. 🗺️ **Route Planning** - Plan charging stops for your journey\n"
-                     "2. 🚨 **Emergency Charging** - Find nearest stations when battery is low\n"
-                     "3. ⚡ **Charging Preferences** - Find stations by your preferences\n\n"
-                     "🎯 Type 1, 2, or 3 to continue!")
+                text=Messages.GREETING_LOCATION_DETECTED)
             return [
                 SlotSet("user_lat", user_lat),
                 SlotSet("user_lng", user_lng),
@@ -184,21 +410,14 @@ class ActionCollectInitialLocation(Action):
         if not conversation_context:
             # First visit, no GPS — ask for location
             dispatcher.utter_message(
-                text="Hello! Welcome to Melbourne EV Charging Assistant! ⚡\n\n"
-                     "📍 Please share your location or type your suburb name (e.g. Richmond) to get started.")
+                text=Messages.GREETING_LOCATION_REQUEST)
             return [SlotSet("conversation_context", ConversationContexts.INITIAL_LOCATION_COLLECTION)]
 
         # Already in INITIAL_LOCATION_COLLECTION — user is typing their suburb
         if user_lat and user_lng:
             # GPS came in on a follow-up message
             dispatcher.utter_message(
-                text="✅ **Location detected!** Now I can help you find the best charging options.\n\n"
-                     "Please select an option:\n\n"
-                     "1. 🗺️ **Route Planning** - Plan charging stops for your journey\n"
-                     "2. 🚨 **Emergency Charging** - Find nearest stations when battery is low\n"
-                     "3. ⚡ **Charging Preferences** - Find stations by your preferences\n\n"
-                     "**🎯 Type 1, 2, or 3 to continue!**"
-            )
+                text=Messages.LOCATION_DETECTED)
 
             return [
                 SlotSet("user_lat", user_lat),
@@ -206,7 +425,7 @@ class ActionCollectInitialLocation(Action):
                 SlotSet("conversation_context", None)
             ]
 
-        message = (tracker.latest_message.get('text') or '').strip()
+        message = _message_text(tracker)
         lower_message = message.lower()
 
         blocked_inputs = {
@@ -249,7 +468,7 @@ class ActionCollectInitialLocation(Action):
             return []
 
         try:
-            coords = data_service._get_location_coordinates(message)
+            coords = await asyncio.to_thread(lambda: get_data_service()._get_location_coordinates(message))
             if coords:
                 lat, lng = coords
                 dispatcher.utter_message(
@@ -292,11 +511,11 @@ class ActionHandleAnyInput(Action):
         return "action_handle_any_input"
 
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = tracker.latest_message.get('text', '').strip()
+        message = _message_text(tracker)
         conversation_context = tracker.get_slot("conversation_context")
 
         lower_msg = message.lower()
-        if any(phrase in lower_msg for phrase in ["thanks", "thank you", "thx", "no thanks", "no thank you"]):
+        if _THANKS_RE.search(lower_msg):
             dispatcher.utter_message(text=Messages.GOODBYE)
             return [SlotSet("conversation_context", ConversationContexts.ENDED)]
 
@@ -305,35 +524,35 @@ class ActionHandleAnyInput(Action):
 
         if message == "1":
             dispatcher.utter_message(
-                text=f"🗺️ **Route Planning**\n\n{Messages.ROUTE_PLANNING_PROMPT}\n\n💡 **Example:** 'from Carlton to Geelong'")
+                text=Messages.ROUTE_PLANNING_INTRO)
             return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
 
         elif message == "2":
 
             dispatcher.utter_message(
-                text=f"🚨 **Emergency Charging**\n\n{Messages.EMERGENCY_PROMPT}\n\n💡 **Example:** 'Richmond'")
+                text=Messages.EMERGENCY_INTRO)
             return [SlotSet("conversation_context", ConversationContexts.EMERGENCY_CHARGING)]
 
         elif message == "3":
 
             dispatcher.utter_message(
-                text=f"⚡ **Charging Preferences**\n\n{Messages.PREFERENCE_PROMPT}\n\n• Cheapest 💰\n• Fastest ⚡\n• Premium 🌟")
+                text=Messages.PREFERENCE_INTRO)
             return [SlotSet("conversation_context", ConversationContexts.PREFERENCE_CHARGING)]
 
         #Quick keyword routing to reduce fallback when users type labels instead if 1/2/3.
-        elif any(k in lower_msg for k in ["route", "trip", "journey", "plan"]):
+        elif _ROUTE_MENU_RE.search(lower_msg):
             dispatcher.utter_message(
-                text=f"🗺️ **Route Planning**\n\n{Messages.ROUTE_PLANNING_PROMPT}\n\n💡 **Example:** 'from Carlton to Geelong'")
+                text=Messages.ROUTE_PLANNING_INTRO)
             return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
         
-        elif any(k in lower_msg for k in ["emergency", "urgent", "battery low", "low battery"]):
+        elif _EMERGENCY_MENU_RE.search(lower_msg):
             dispatcher.utter_message(
-                text=f"🚨 **Emergency Charging**\n\n{Messages.EMERGENCY_PROMPT}\n\n💡 **Example:** 'Richmond'")
+                text=Messages.EMERGENCY_INTRO)
             return [SlotSet("conversation_context", ConversationContexts.EMERGENCY_CHARGING)]
         
-        elif any(k in lower_msg for k in ["preference", "cheapest", "fastest", "premium"]):
+        elif _PREFERENCE_MENU_RE.search(lower_msg):
             dispatcher.utter_message(
-                text=f"⚡ **Charging Preferences**\n\n{Messages.PREFERENCE_PROMPT}\n\n• Cheapest 💰\n• Fastest ⚡\n• Premium 🌟")
+                text=Messages.PREFERENCE_INTRO)
             return [SlotSet("conversation_context", ConversationContexts.PREFERENCE_CHARGING)]
         
         # If not a valid menu option, show the menu again
@@ -352,51 +571,51 @@ class ActionHandleMenuSelection(Action):
     def name(self) -> Text:
         return "action_handle_menu_selection"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = tracker.latest_message.get('text', '').strip()
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        message = _message_text(tracker)
+        lower_message = message.lower()
         conversation_context = tracker.get_slot("conversation_context")
 
         if conversation_context == ConversationContexts.ROUTE_PLANNING_RESULTS:
-            lower = message.lower().strip()
             # Auto-fire guard: when context just changed to route_planning_results the
             # message is still the route input (e.g. "to Carlton") — skip station matching.
-            if (re.match(r'^\d+$', lower) or ' to ' in lower
-                    or lower.startswith('to ') or lower.startswith('from ')):
+            if (_DIGITS_RE.match(lower_message) or ' to ' in lower_message
+                    or lower_message.startswith('to ') or lower_message.startswith('from ')):
                 return []
 
             # Get the route information from slots
             start_location = tracker.get_slot("start_location")
             end_location = tracker.get_slot("end_location")
 
-            stations = data_service.get_route_stations(
-                start_location, end_location)
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_route_stations(start_location, end_location))
 
             if stations:
                 # Look for a station that matches the user's input
                 selected_station = None
                 for station in stations:
                     station_name = station.get('name', '').lower()
-                    if message.lower() in station_name or station_name in message.lower():
+                    if lower_message in station_name or station_name in lower_message:
                         selected_station = station
                         break
 
                 if selected_station:
                     # Show detailed information about the selected station
-                    response = f"🔋 **Station Details: {selected_station.get('name', 'Unknown Station')}**\n\n"
-                    response += f"📍 **Location:** {selected_station.get('suburb', 'Location available')}\n"
-                    response += f"⚡ **Power:** {selected_station.get('power', 'Power info available')} charging\n"
-                    response += f"💰 **Cost:** {selected_station.get('cost', 'Cost info available')}\n"
-                    response += f"🔌 **Connector:** {selected_station.get('connector_type', 'Connector info available')}\n"
-                    response += f"📱 **Network:** {selected_station.get('network', 'Network info available')}\n\n"
-
-                    # Add route context
-                    response += f"🗺️ **Route:** {start_location} → {end_location}\n\n"
-
-                    response += "**What would you like to do next?**\n\n"
-                    response += "• **Get directions** 🧭\n"
-                    response += "• **Check availability** ✅\n"
-                    response += "• **Plan another route** 🗺️\n"
-                    response += "• **Return to main menu** 🏠"
+                    response = "".join([
+                        f"🔋 **Station Details: {selected_station.get('name', 'Unknown Station')}**\n\n",
+                        f"📍 **Location:** {selected_station.get('suburb', 'Location available')}\n",
+                        f"⚡ **Power:** {selected_station.get('power', 'Power info available')} charging\n",
+                        f"💰 **Cost:** {selected_station.get('cost', 'Cost info available')}\n",
+                        f"🔌 **Connector:** {selected_station.get('connector_type', 'Connector info available')}\n",
+                        f"📱 **Network:** {selected_station.get('network', 'Network info available')}\n\n",
+                        # Add route context
+                        f"🗺️ **Route:** {start_location} → {end_location}\n\n",
+                        "**What would you like to do next?**\n\n"
+                        "• **Get directions** 🧭\n"
+                        "• **Check availability** ✅\n"
+                        "• **Plan another route** 🗺️\n"
+                        "• **Return to main menu** 🏠",
+                    ])
 
                     dispatcher.utter_message(text=response)
 
@@ -420,36 +639,14 @@ class ActionHandleMenuSelection(Action):
                 )
                 return []
 
-        if conversation_context == ConversationContexts.ROUTE_PLANNING and ('from' in message.lower() and 'to' in message.lower()):
-            # Extract start and end locations from the message
-            start_location = None
-            end_location = None
-
-            # Split by 'from' and take everything after it
-            after_from = message.lower().split('from', 1)[1]
-
-            # Simple string search for " to " (with spaces)
-            to_index = after_from.find(' to ')
-
-            if to_index != -1:
-                start_location = after_from[:to_index].strip()
-                # +4 for " to " (including spaces)
-                end_location = after_from[to_index + 4:].strip()
-
-                if start_location and end_location and len(start_location) > 0 and len(end_location) > 0:
-                    pass
-                else:
-                    # Debug trimmed
-                    start_location = None
-                    end_location = None
-            else:
-                start_location = None
-                end_location = None
+        if conversation_context == ConversationContexts.ROUTE_PLANNING and ('from' in lower_message and 'to' in lower_message):
+            # Everything after the first 'from', split on the first " to " (with spaces)
+            start_location, end_location = _parse_route(lower_message)
 
             if not start_location or not end_location:
                 if not start_location and not end_location:
                     dispatcher.utter_message(
-                        text="🗺️ **Route Planning**\n\nProvide your route: 'from [start] to [destination]'")
+                        text=Messages.ROUTE_FORMAT_HELP)
                 elif not start_location:
                     dispatcher.utter_message(
                         text=f"🗺️ **Route Planning**\n\n✅ End location: {end_location}\n❌ Missing start location\n\nProvide: 'from [start] to {end_location}'")
@@ -464,15 +661,11 @@ class ActionHandleMenuSelection(Action):
             if start_location and end_location:
                 # Set the slots and find charging stations
                 # Try to get charging stations from the data service
-                stations = data_service.get_route_stations(
-                    start_location, end_location)
+                stations = await asyncio.to_thread(
+                    lambda: get_data_service().get_route_stations(start_location, end_location))
 
                 if stations:
-                    start_display = "Your Location" if isinstance(start_location, tuple) else start_location
-                    _send_station_cards(dispatcher, stations, limit=10)
-                    dispatcher.utter_message(
-                        text=f"Found {len(stations)} station{'s' if len(stations) != 1 else ''} along your route "
-                             f"from {start_display} to {end_location}. Tap a card or type a station name.")
+                    _announce_route_stations(dispatcher, stations, start_location, end_location)
                     displayed = [{'name': s.get('name', f'Station {i+1}')} for i, s in enumerate(stations[:10])]
 
                     return [
@@ -499,7 +692,7 @@ class ActionHandleMenuSelection(Action):
         if conversation_context == ConversationContexts.EMERGENCY_CHARGING:
             return []
 
-        if conversation_context == ConversationContexts.PREFERENCE_CHARGING and any(word in message.lower() for word in ['cheapest', 'fastest', 'premium', 'cheap', 'fast']):
+        if conversation_context == ConversationContexts.PREFERENCE_CHARGING and _match_preference(lower_message):
             return []
 
         if message == "1":
@@ -547,8 +740,8 @@ class ActionHandleRouteInput(Action):
     def name(self) -> Text:
         return "action_handle_route_input"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = tracker.latest_message.get('text', '').lower().strip()
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        raw_text = _message_text(tracker)
         conversation_context = tracker.get_slot("conversation_context")
 
         if conversation_context != ConversationContexts.ROUTE_PLANNING:
@@ -558,87 +751,28 @@ class ActionHandleRouteInput(Action):
         stored_lng = tracker.get_slot("user_lng")
 
         if stored_lat and stored_lng:
-            raw_text = tracker.latest_message.get('text', '') or ''
-            raw_text = raw_text.strip()
             if raw_text:
-                import re
                 lower_raw = raw_text.lower()
                 dest_text = None
 
                 # Destination-only formats when user location is already known:
                 # 1) "to Collingwood"
-                if re.match(r'^\s*to\b', raw_text, flags=re.IGNORECASE):
-                    dest_text = re.sub(r'^\s*to\b', '', raw_text,
-                                       flags=re.IGNORECASE).strip()
+                to_match = _LEADING_TO_RE.match(raw_text)
+                if to_match:
+                    dest_text = raw_text[to_match.end():].strip()
                 # 2) "Collingwood" (short destination phrase only)
-                elif 'from' not in lower_raw and ' to ' not in lower_raw and len(raw_text.split()) <= 4:
+                elif 'from' not in lower_raw and ' to ' not in lower_raw and len(raw_text.split(None, 4)) <= 4:
                     dest_text = raw_text
 
                 if dest_text:
                     start_location = (stored_lat, stored_lng)
                     end_location = dest_text
-                    return self._process_route(dispatcher, start_location, end_location)
+                    return await self._process_route(dispatcher, start_location, end_location)
 
         # Check for traditional "from [start] to [destination]" format
-        parsed_start, parsed_end = extract_from_to_route(
-            tracker.latest_message.get('text', '') or ''
-        )
+        parsed_start, parsed_end = extract_from_to_route(raw_text)
         if parsed_start and parsed_end:
-
-            # Extract start and end locations from the message
-            start_location = parsed_start
-            end_location = parsed_end
-
-            if not start_location or not end_location:
-                if not start_location and not end_location:
-                    dispatcher.utter_message(
-                        text="🗺️ **Route Planning**\n\nProvide your route: 'from [start] to [destination]'"
-                    )
-                elif not start_location:
-                    dispatcher.utter_message(
-                        text=f"🗺️ **Route Planning**\n\n✅ End location: {end_location}\n❌ Missing start location\n\nProvide: 'from [start] to {end_location}'"
-                    )
-                else:
-                    dispatcher.utter_message(
-                        text=f"🗺️ **Route Planning**\n\n✅ Start location: {start_location}\n❌ Missing end location\n\nProvide: 'from {start_location} to [destination]'"
-                    )
-
-                return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
-
-            if start_location and end_location:
-                try:
-                    stations = data_service.get_route_stations(start_location, end_location)
-
-                    if stations:
-                        start_display = "Your Location" if isinstance(start_location, tuple) else start_location
-                        _send_station_cards(dispatcher, stations, limit=10)
-                        dispatcher.utter_message(
-                            text=f"Found {len(stations)} station{'s' if len(stations) != 1 else ''} along your route "
-                                 f"from {start_display} to {end_location}. Tap a card or type a station name.")
-                        displayed = stations[:10]
-                        return [
-                            SlotSet("start_location", start_location),
-                            SlotSet("end_location", end_location),
-                            SlotSet("displayed_stations", displayed),
-                            SlotSet("conversation_context",
-                                    ConversationContexts.ROUTE_PLANNING_RESULTS)
-                        ]
-                    else:
-                        dispatcher.utter_message(
-                            text=f"❌ **No charging stations found** along route: {start_location} → {end_location}\n\n"
-                                 "💡 **Try:**\n"
-                                 "• A different destination\n"
-                                 "• Check if both locations are in Melbourne area"
-                        )
-                        return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
-
-                except Exception as e:
-                    print(f"Error finding route stations: {e}")
-                    dispatcher.utter_message(
-                        text=f"❌ **Error processing route**\n\n"
-                             f"Please try again or use the format: 'from [start] to [destination]'"
-                    )
-                    return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
+            return await self._process_route(dispatcher, parsed_start, parsed_end)
 
         else:
             dispatcher.utter_message(
@@ -650,16 +784,14 @@ class ActionHandleRouteInput(Action):
             )
             return []
 
-    def _process_route(self, dispatcher: CollectingDispatcher, start_location: str, end_location: str) -> List[Dict[Text, Any]]:
+    async def _process_route(self, dispatcher: CollectingDispatcher, start_location: str, end_location: str) -> List[Dict[Text, Any]]:
         try:
-            stations = data_service.get_route_stations(start_location, end_location)
+            # Route lookup blocks on pandas and TomTom; keep it off the action server's event loop
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_route_stations(start_location, end_location))
 
             if stations:
-                start_display = "Your Location" if isinstance(start_location, tuple) else start_location
-                _send_station_cards(dispatcher, stations, limit=10)
-                dispatcher.utter_message(
-                    text=f"Found {len(stations)} station{'s' if len(stations) != 1 else ''} along your route "
-                         f"from {start_display} to {end_location}. Tap a card or type a station name.")
+                _announce_route_stations(dispatcher, stations, start_location, end_location)
                 displayed = stations[:10]
                 return [
                     SlotSet("start_location", start_location),
@@ -678,10 +810,9 @@ class ActionHandleRouteInput(Action):
                 return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
 
         except Exception as e:
+            logger.error("Error finding route stations: %s", e)
             dispatcher.utter_message(
-                text=f"❌ **Error processing route**\n\n"
-                     f"Please try again or use the format: 'from [start] to [destination]'"
-            )
+                text=ErrorMessages.ROUTE_PROCESSING)
             return [SlotSet("conversation_context", ConversationContexts.ROUTE_PLANNING)]
 
 """
@@ -694,14 +825,14 @@ class ActionHandlePreferenceInput(Action):
         return "action_handle_preference_input"
 
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = tracker.latest_message.get('text', '').lower().strip()
+        message = _normalized_message(tracker)
         conversation_context = tracker.get_slot("conversation_context")
 
         # Only process if we're in preference charging context
         if conversation_context != ConversationContexts.PREFERENCE_CHARGING:
             return []
 
-        if message in ["cheapest", "fastest", "premium"]:
+        if message in _PREFERENCE_CHOICES:
             preference_type = message
 
             dispatcher.utter_message(
@@ -730,42 +861,20 @@ class ActionHandleRouteInfo(Action):
     def name(self) -> Text:
         return "action_handle_route_info"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
+        raw_text = _message_text(tracker)
         if conversation_context == ConversationContexts.ROUTE_PLANNING_RESULTS:
-            message = tracker.latest_message.get('text', '').lower().strip()
+            message = raw_text.lower()
             start_location = tracker.get_slot("start_location")
             end_location = tracker.get_slot("end_location")
 
-            stations = data_service.get_route_stations(
-                start_location, end_location)
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_route_stations(start_location, end_location))
             if stations:
                 # Prefer stations previously displayed if available
                 displayed = tracker.get_slot("displayed_stations") or []
-                selected_station = None
-
-                def normalize(text: str) -> str:
-                    return (text or '').lower().strip()
-
-                # Try exact/contains match against displayed names first
-                for s in displayed:
-                    name = normalize(s.get('name'))
-                    if name and (name in message or message in name):
-                        selected_station = next(
-                            (st for st in stations if normalize(st.get('name')) == name), None)
-                        if not selected_station:
-                            selected_station = next(
-                                (st for st in stations if name in normalize(st.get('name'))), None)
-                        if selected_station:
-                            break
-
-                # Fallback: search all stations in current route list
-                if not selected_station:
-                    for st in stations:
-                        st_name = normalize(st.get('name'))
-                        if st_name and (st_name in message or message in st_name):
-                            selected_station = st
-                            break
+                selected_station = _match_displayed_station(displayed, stations, message)
 
                 if selected_station:
                     # Reuse the existing display util for details
@@ -786,20 +895,17 @@ class ActionHandleRouteInfo(Action):
         start_location = None
         end_location = None
 
-        raw_text = tracker.latest_message.get('text', '') or ''
-        raw_text = raw_text.strip()
         if raw_text:
             # Handle explicit "from X to Y" messages here as a safety net when route_info
             # is predicted and this action is selected.
             parsed_start, parsed_end = extract_from_to_route(raw_text)
             if parsed_start and parsed_end:
-                return self._find_route_stations(dispatcher, parsed_start, parsed_end)
+                return await self._find_route_stations(dispatcher, parsed_start, parsed_end)
 
             # Only treat messages that START with 'to' as destination-only inputs here
-            import re
-            if re.match(r'^\s*to\b', raw_text, flags=re.IGNORECASE):
-                dest_text = re.sub(r'^\s*to\b', '', raw_text,
-                                   flags=re.IGNORECASE).strip()
+            to_match = _LEADING_TO_RE.match(raw_text)
+            if to_match:
+                dest_text = raw_text[to_match.end():].strip()
                 if dest_text and 'from' not in raw_text.lower():
                     stored_lat = tracker.get_slot("user_lat")
                     stored_lng = tracker.get_slot("user_lng")
@@ -810,7 +916,7 @@ class ActionHandleRouteInfo(Action):
                             SlotSet("start_location", start_location),
                             SlotSet("end_location", end_location)
                         ]
-                        return slots + self._find_route_stations(dispatcher, start_location, end_location)
+                        return slots + await self._find_route_stations(dispatcher, start_location, end_location)
                     else:
                         dispatcher.utter_message(
                             text=f"🗺️ **Route Planning**\n\n"
@@ -822,16 +928,12 @@ class ActionHandleRouteInfo(Action):
                         return []
         return []
 
-    def _find_route_stations(self, dispatcher: CollectingDispatcher, start_location, end_location: str) -> List[Dict[Text, Any]]:
-        stations = data_service.get_route_stations(
-            start_location, end_location)
+    async def _find_route_stations(self, dispatcher: CollectingDispatcher, start_location, end_location: str) -> List[Dict[Text, Any]]:
+        stations = await asyncio.to_thread(
+            lambda: get_data_service().get_route_stations(start_location, end_location))
 
         if stations:
-            start_display = "Your Location" if isinstance(start_location, tuple) else start_location
-            _send_station_cards(dispatcher, stations, limit=10)
-            dispatcher.utter_message(
-                text=f"Found {len(stations)} station{'s' if len(stations) != 1 else ''} along your route "
-                     f"from {start_display} to {end_location}. Tap a card or type a station name.")
+            _announce_route_stations(dispatcher, stations, start_location, end_location)
             displayed = [{'name': s.get('name', f'Station {i+1}')} for i, s in enumerate(stations[:10])]
             return [
                 SlotSet("conversation_context",
@@ -843,8 +945,8 @@ class ActionHandleRouteInfo(Action):
         else:
             if REAL_TIME_INTEGRATION_AVAILABLE and real_time_manager:
                 try:
-                    real_time_data = real_time_manager.get_enhanced_route_planning(
-                        start_location, end_location)
+                    real_time_data = await asyncio.to_thread(
+                        lambda: real_time_manager.get_enhanced_route_planning(start_location, end_location))
 
                     if real_time_data.get('success'):
                         response = self._format_real_time_route_response(
@@ -857,7 +959,7 @@ class ActionHandleRouteInfo(Action):
                             SlotSet("end_location", end_location)
                         ]
                 except Exception as e:
-                    print(f"Real-time integration error: {e}")
+                    logger.error("Real-time integration error: %s", e)
 
             dispatcher.utter_message(
                 text=f"No charging stations found from {start_location} to {end_location}. Please try a different route.")
@@ -866,23 +968,23 @@ class ActionHandleRouteInfo(Action):
     def _format_real_time_route_response(self, start_location, end_location: str, real_time_data: Dict[str, Any]) -> str:
         start_display = "Your Location" if isinstance(start_location, tuple) else start_location
 
-        response = f"🎯 **Real-time Route: {start_display} → {end_location}**\n\n"
+        parts = [f"🎯 **Real-time Route: {start_display} → {end_location}**\n\n"]
 
         if real_time_data.get('route_info'):
             route = real_time_data['route_info']
-            response += f"🗺️ **Route:** {route.get('distance_km', 0):.1f} km, {route.get('duration_minutes', 0):.0f} min\n"
+            parts.append(f"🗺️ **Route:** {route.get('distance_km', 0):.1f} km, {route.get('duration_minutes', 0):.0f} min\n")
             if route.get('traffic_delay_minutes', 0) > 0:
-                response += f"🚦 **Traffic Delay:** +{route.get('traffic_delay_minutes', 0):.0f} min\n"
+                parts.append(f"🚦 **Traffic Delay:** +{route.get('traffic_delay_minutes', 0):.0f} min\n")
 
         if real_time_data.get('traffic_info'):
             traffic = real_time_data['traffic_info']
-            response += f"🚦 **Traffic:** {traffic.get('traffic_status', 'Unknown')}\n"
-            response += f"⚡ **Speed:** {traffic.get('current_speed_kmh', 0)} km/h\n"
+            parts.append(f"🚦 **Traffic:** {traffic.get('traffic_status', 'Unknown')}\n")
+            parts.append(f"⚡ **Speed:** {traffic.get('current_speed_kmh', 0)} km/h\n")
 
-        response += f"\n⚡ **Charging Stations:** Finding stations with real-time data...\n"
-        response += f"💡 **Source:** TomTom API | 🕐 **Updated:** Just now"
+        parts.append("\n⚡ **Charging Stations:** Finding stations with real-time data...\n"
+                     "💡 **Source:** TomTom API | 🕐 **Updated:** Just now")
 
-        return response
+        return "".join(parts)
 
 
 class ActionHandleEmergencyCharging(Action):
@@ -896,7 +998,7 @@ class ActionHandleEmergencyCharging(Action):
 
         if not stored_lat or not stored_lng:
             dispatcher.utter_message(
-                text="❌ I don't have your current location stored.\n\nPlease share your location first.")
+                text=Messages.NO_STORED_LOCATION)
             return []
 
         # Ask for connector type/car model first
@@ -911,9 +1013,9 @@ class ActionHandleEmergencyLocationInput(Action):
     def name(self) -> Text:
         return "action_handle_emergency_location_input"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
-        if conversation_context not in [ConversationContexts.EMERGENCY_CHARGING, ConversationContexts.EMERGENCY_RESULTS]:
+        if conversation_context not in _EMERGENCY_CONTEXTS:
             return []
 
         # Check for stored user location
@@ -922,7 +1024,7 @@ class ActionHandleEmergencyLocationInput(Action):
 
         if not stored_lat or not stored_lng:
             dispatcher.utter_message(
-                text="❌ I don't have your current location stored.\n\nPlease share your location first.")
+                text=Messages.NO_STORED_LOCATION)
             return []
 
         # Use stored coordinates
@@ -930,16 +1032,15 @@ class ActionHandleEmergencyLocationInput(Action):
 
         if current_location:
             # Handle polite termination within emergency flow
-            raw_message = tracker.latest_message.get('text', '')
-            message = raw_message.lower().strip()
-            if any(phrase in message for phrase in ["thanks", "thank you", "thx"]):
+            message = _normalized_message(tracker)
+            if _THANKS_RE.search(message):
                 dispatcher.utter_message(text=Messages.GOODBYE)
                 return [SlotSet("conversation_context", ConversationContexts.ENDED)]
 
             connector = self._infer_connector_from_message(message)
             start_location = (stored_lat, stored_lng)
-            stations = data_service.get_emergency_stations_from_coordinates(
-                start_location)
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_emergency_stations_from_coordinates(start_location))
 
             if stations:
                 if connector:
@@ -1001,17 +1102,19 @@ class ActionHandleEmergencyLocationInput(Action):
                     text=f"❌ No emergency charging stations found near {current_location}. Please try a different area.")
                 return []
 
-    def _find_emergency_stations(self, dispatcher: CollectingDispatcher, current_location: str) -> List[Dict[Text, Any]]:
-        stations = data_service.get_emergency_stations(current_location)
+    async def _find_emergency_stations(self, dispatcher: CollectingDispatcher, current_location: str) -> List[Dict[Text, Any]]:
+        stations = await asyncio.to_thread(
+            lambda: get_data_service().get_emergency_stations(current_location))
 
         if stations:
             _send_station_cards(dispatcher, stations, limit=5)
-            response = f"🚨 Emergency charging stations near {current_location}:\n\n"
-
-            for i, station in enumerate(stations, 1):
-                response += f"{i}. **{station['name']}** - {station['distance_km']}km away, {station['cost']} ✅\n"
-
-            response += "\nAll have available charging points. Which one?"
+            parts = [f"🚨 Emergency charging stations near {current_location}:\n\n"]
+            parts.extend(
+                f"{i}. **{station['name']}** - {station['distance_km']}km away, {station['cost']} ✅\n"
+                for i, station in enumerate(stations, 1)
+            )
+            parts.append("\nAll have available charging points. Which one?")
+            response = "".join(parts)
             dispatcher.utter_message(text=response)
             return [SlotSet("conversation_context", ConversationContexts.EMERGENCY_RESULTS)]
         else:
@@ -1022,76 +1125,9 @@ class ActionHandleEmergencyLocationInput(Action):
     def _infer_connector_from_message(self, message: str) -> Optional[str]:
         msg = (message or '').lower()
 
-        # Direct connector mentions
-        if 'chademo' in msg:
-            return 'chademo'
-        if 'ccs2' in msg or 'ccs 2' in msg or 'ccs' in msg:
-            return 'ccs'
-        if 'type 2' in msg or 'mennekes' in msg:
-            return 'type 2'
-        if 'tesla' in msg:
-            return 'tesla'
-
-        car_ccs = [
-            # Hyundai/Kia
-            'ioniq', 'kona', 'ev6', 'e-niro', 'niro', 'ev6', 'soul ev',
-            # MG
-            'mg zs', 'mg 4', 'mg 5', 'mg marvel', 'mg cyberster',
-            # Polestar/Volvo
-            'polestar', 'volvo xc40', 'volvo c40', 'volvo ex30', 'volvo ex90',
-            # BYD
-            'byd', 'atto 3', 'dolphin', 'seal', 'tang', 'han',
-            # Volkswagen Group
-            'id.3', 'id.4', 'id.5', 'id.buzz', 'audi e-tron', 'audi q4', 'porsche taycan',
-            # BMW
-            'bmw i3', 'bmw i4', 'bmw ix', 'bmw i7', 'bmw i5',
-            # Mercedes
-            'eqa', 'eqb', 'eqc', 'eqe', 'eqs', 'mercedes ev',
-            # Ford
-            'mustang mach-e', 'f-150 lightning', 'e-transit',
-            # Chevrolet
-            'bolt', 'bolt euv', 'silverado ev', 'blazer ev',
-            # Other popular EVs
-            'rivian r1t', 'rivian r1s', 'lucid air', 'fisker ocean', 'canoo'
-        ]
-
-        car_chademo = [
-            # Nissan
-            'leaf', 'ariya',
-            # Mitsubishi
-            'outlander phev', 'i-miev',
-            # Kia (older models)
-            'soul ev 2014-2019'
-        ]
-
-        car_type2 = [
-            # Tesla (older models in Europe)
-            'tesla model s', 'tesla model x', 'tesla model 3', 'tesla model y',
-            # European EVs
-            'renault zoe', 'peugeot e-208', 'opel corsa-e', 'fiat 500e',
-            # Japanese EVs
-            'toyota bz4x', 'subaru solterra', 'lexus rz'
-        ]
-
-        car_tesla = [
-            # Tesla (North America/Asia)
-            'tesla model s', 'tesla model x', 'tesla model 3', 'tesla model y',
-            'cybertruck', 'roadster'
-        ]
-
-        # Check for car models
-        for kw in car_ccs:
-            if kw in msg:
-                return 'ccs'
-        for kw in car_chademo:
-            if kw in msg:
-                return 'chademo'
-        for kw in car_type2:
-            if kw in msg:
-                return 'type 2'
-        for kw in car_tesla:
-            if kw in msg:
-                return 'tesla'
+        for connector, pattern in _CONNECTOR_PATTERNS:
+            if pattern.search(msg):
+                return connector
 
         return None
 
@@ -1103,43 +1139,15 @@ class ActionHandleEmergencyLocationInput(Action):
         if connector in conn_str or connector in power_str:
             return True
 
-        # Numeric code mapping for Type 2 (Mennekes) — OpenChargeMap ID 25
-        if connector == 'type 2':
-            type2_codes = ['25', '1036']
-            for code in type2_codes:
-                if code in conn_str:
-                    return True
-
-        # Numeric code mapping for CCS — OpenChargeMap ID 33 (CCS2 used in AU)
-        elif connector == 'ccs':
-            ccs_codes = ['33', '1', '21', '31']
-            for code in ccs_codes:
-                if code in conn_str:
-                    return True
-
-        # Numeric code mapping for CHAdeMO — OpenChargeMap ID 2
-        elif connector == 'chademo':
-            chademo_codes = ['2', '4', '24', '34']
-            for code in chademo_codes:
-                if code in conn_str:
-                    return True
-
-        # Numeric code mapping for Tesla — Superchargers use CCS2 (33) in AU
-        elif connector == 'tesla':
-            tesla_codes = ['33', '1036']
-            for code in tesla_codes:
-                if code in conn_str:
-                    return True
-
-        return False
+        return any(code in conn_str for code in _CONNECTOR_CODES.get(connector, ()))
 
 
 class ActionHandlePreferenceCharging(Action):
     def name(self) -> Text:
         return "action_handle_preference_charging"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
-        message = tracker.latest_message.get('text', '').lower().strip()
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+        message = _normalized_message(tracker)
         conversation_context = tracker.get_slot("conversation_context")
         preference = None
 
@@ -1147,39 +1155,18 @@ class ActionHandlePreferenceCharging(Action):
             start_location = tracker.get_slot("start_location")
             end_location = tracker.get_slot("end_location")
             try:
-                stations = data_service.get_route_stations(
-                    start_location, end_location)
+                stations = await asyncio.to_thread(
+                    lambda: get_data_service().get_route_stations(start_location, end_location))
                 if stations:
                     displayed = tracker.get_slot("displayed_stations") or []
-                    selected_station = None
-
-                    def normalize(text: str) -> str:
-                        return (text or '').lower().strip()
-
-                    for s in displayed:
-                        name = normalize(s.get('name'))
-                        if name and (name in message or message in name):
-                            selected_station = next(
-                                (st for st in stations if normalize(st.get('name')) == name), None)
-                            if not selected_station:
-                                selected_station = next(
-                                    (st for st in stations if name in normalize(st.get('name'))), None)
-                            if selected_station:
-                                break
-
-                    if not selected_station:
-                        for st in stations:
-                            st_name = normalize(st.get('name'))
-                            if st_name and (st_name in message or message in st_name):
-                                selected_station = st
-                                break
+                    selected_station = _match_displayed_station(displayed, stations, message)
 
                     if selected_station:
                         return ActionHandleRouteStationSelection()._display_station_details(
                             dispatcher, selected_station, start_location, end_location
                         )
             except Exception as e:
-                print(f"PreferenceCharging quick-select error: {e}")
+                logger.error("PreferenceCharging quick-select error: %s", e)
 
             # If no station matched, ask the user to type exact name again
             dispatcher.utter_message(
@@ -1194,13 +1181,7 @@ class ActionHandlePreferenceCharging(Action):
         if conversation_context != ConversationContexts.PREFERENCE_CHARGING:
             return []
 
-        if any(word in message for word in ['cheapest', 'cheap', 'lowest', 'cost']):
-            preference = PreferenceTypes.CHEAPEST
-        elif any(word in message for word in ['fastest', 'fast', 'speed', 'ultra']):
-            preference = PreferenceTypes.FASTEST
-
-        elif any(word in message for word in ['premium', 'best', 'luxury', 'amenities']):
-            preference = PreferenceTypes.PREMIUM
+        preference = _match_preference(message)
 
         if preference:
             # Check for stored user location first
@@ -1214,8 +1195,8 @@ class ActionHandlePreferenceCharging(Action):
                 # Get stations by preference using stored coordinates
                 try:
                     coords = (stored_lat, stored_lng)
-                    stations = data_service.get_stations_by_preference(
-                        coords, preference)
+                    stations = await asyncio.to_thread(
+                        lambda: get_data_service().get_stations_by_preference(coords, preference))
 
                     if stations:
                         _send_station_cards(dispatcher, stations, limit=5)
@@ -1232,6 +1213,7 @@ class ActionHandlePreferenceCharging(Action):
                         return [SlotSet("charging_preference", preference)]
 
                 except Exception as e:
+                    logger.exception("Error finding %s stations", preference)
                     dispatcher.utter_message(
                         text=f"❌ Error finding {preference.lower()} stations: {str(e)}")
                     return [SlotSet("charging_preference", preference)]
@@ -1253,13 +1235,11 @@ class ActionGetDirectionsById(Action):
     def name(self) -> Text:
         return "action_get_directions_by_id"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         # Extract station_id from slash intent payload
-        station_id: Optional[str] = None
-        for ent in tracker.latest_message.get("entities", []) or []:
-            if ent.get("entity") == "station_id" and ent.get("value") is not None:
-                station_id = str(ent.get("value"))
-                break
+        station_id: Optional[str] = _latest_entity(tracker, "station_id")
+        if station_id is not None:
+            station_id = str(station_id)
 
         displayed: List[Dict[str, Any]] = tracker.get_slot("displayed_stations") or []
 
@@ -1284,11 +1264,11 @@ class ActionGetDirectionsById(Action):
         dest_lat: Optional[float] = None
         dest_lng: Optional[float] = None
         if isinstance(station_id, str) and "," in station_id:
+            lat_str, _, lng_str = station_id.partition(",")
             try:
-                parts = station_id.split(",", 1)
-                dest_lat = float(parts[0].strip())
-                dest_lng = float(parts[1].strip())
-            except (ValueError, IndexError):
+                dest_lat = float(lat_str)
+                dest_lng = float(lng_str)
+            except ValueError:
                 pass
 
         # Get destination label
@@ -1321,10 +1301,10 @@ class ActionGetDirectionsById(Action):
                 and real_time_manager.api_manager
                 and user_lat is not None and dest_lat is not None):
             try:
-                route_data = real_time_manager.api_manager.get_real_time_route(
-                    (float(user_lat), float(user_lng)),
-                    (float(dest_lat), float(dest_lng))
-                )
+                origin = (float(user_lat), float(user_lng))
+                dest = (float(dest_lat), float(dest_lng))
+                route_data = await asyncio.to_thread(
+                    lambda: real_time_manager.api_manager.get_real_time_route(origin, dest))
                 if route_data:
                     route_info = {
                         "distance_km": route_data.get("distance_km"),
@@ -1370,10 +1350,10 @@ class ActionHandlePreferenceLocationInput(Action):
     def name(self) -> Text:
         return "action_handle_preference_location_input"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         preference = tracker.get_slot("charging_preference")
         location = tracker.get_slot(
-            "current_location") or tracker.latest_message.get('text', '').strip()
+            "current_location") or _message_text(tracker)
 
         if not preference:
             dispatcher.utter_message(
@@ -1384,14 +1364,14 @@ class ActionHandlePreferenceLocationInput(Action):
             dispatcher.utter_message(text="Please provide your location.")
             return []
 
-        coords = data_service._get_location_coordinates(location)
+        coords = await asyncio.to_thread(lambda: get_data_service()._get_location_coordinates(location))
         if not coords:
             dispatcher.utter_message(
-                text=f"❌ I can't find charging stations in {location}.")
+                text=ErrorMessages.LOCATION_NOT_FOUND.format_map({'location': location}))
             return []
 
-        stations = data_service.get_stations_by_preference(
-            coords, preference)
+        stations = await asyncio.to_thread(
+            lambda: get_data_service().get_stations_by_preference(coords, preference))
 
         if stations:
             _send_station_cards(dispatcher, stations, limit=5)
@@ -1407,144 +1387,116 @@ class ActionHandlePreferenceLocationInput(Action):
             return []
 
 
-class ActionHandleRouteStationSelection(Action):
+class _StationSelectionAction(Action, ABC):
+    """Shared replies for the route, emergency and preference station-selection actions."""
+
+    # Abstract so the SDK's action scan skips this base when registering actions
+    @abstractmethod
+    def name(self) -> Text:
+        ...
+
+    def _show_station_details(self, dispatcher: CollectingDispatcher, station: Dict, header: str) -> List[Dict[Text, Any]]:
+        dispatcher.utter_message(text=_format_station_details(header, station))
+        return [
+            SlotSet("conversation_context",
+                    ConversationContexts.STATION_DETAILS),
+            SlotSet("selected_station", station.get('name'))
+        ]
+
+    def _send_directions(self, dispatcher: CollectingDispatcher, origin: str, station: Dict) -> None:
+        maps_link = ActionAdvancedDirections()._build_maps_link(
+            origin, station.get('address') or station.get('name'))
+        dispatcher.utter_message(
+            text=f"🧭 **Directions**\n\n"
+                 f"Start: {origin}\n"
+                 f"Destination: {station.get('name')}\n\n"
+                 f"🔗 {maps_link}")
+
+    def _direct_to_station(self, dispatcher: CollectingDispatcher, station: Dict, origin: Optional[str]) -> List[Dict[Text, Any]]:
+        """Send directions and close the selection; traffic follows only when the origin is known."""
+        self._send_directions(dispatcher, origin or "My Location", station)
+        events: List[Dict[Text, Any]] = [
+            SlotSet("selected_station", station.get('name')),
+            SlotSet("end_location", station.get('name')),
+            SlotSet("conversation_context", None),
+        ]
+        if origin:
+            events.append(SlotSet("start_location", origin))
+            events.append(FollowupAction("action_traffic_info"))
+        return events
+
+
+class ActionHandleRouteStationSelection(_StationSelectionAction):
     def name(self) -> Text:
         return "action_handle_route_station_selection"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
         # Allow selection both right after route results and after a comparison view
-        if conversation_context not in [ConversationContexts.ROUTE_PLANNING_RESULTS, ConversationContexts.STATION_DETAILS]:
+        if conversation_context not in _ROUTE_SELECTION_CONTEXTS:
 
-            pref_contexts = [ConversationContexts.PREFERENCE_CHARGING,
-                             ConversationContexts.PREFERENCE_RESULTS]
-            if conversation_context in pref_contexts:
-                displayed = tracker.get_slot("displayed_stations") or []
-                names = ", ".join([s.get('name')
-                                   for s in displayed]) or "the list above"
-                dispatcher.utter_message(
-                    text=(
-                        "❌ I can't match that to a station from the current list. "
-                        f"Please type one of: {names}."
-                    )
-                )
+            if conversation_context in _PREFERENCE_CONTEXTS:
+                dispatcher.utter_message(text=ErrorMessages.STATION_NOT_IN_LIST.format_map(
+                    {'names': _displayed_station_names(tracker)}))
                 return []
             # If no context, likely the input didn't include a recognisable station or route
-            dispatcher.utter_message(
-                text=(
-                    "❌ I couldn't determine a destination. "
-                    "This can happen if the station name isn't in the dataset or wasn't clear. "
-                )
-            )
+            dispatcher.utter_message(text=ErrorMessages.UNKNOWN_DESTINATION)
             return []
 
-        message = tracker.latest_message.get('text', '').lower().strip()
-        decision_phrases = [
-            "i go with", "i choose", "i select", "i pick",
-            "i would like to go to", "i would like to go", "i would like",
-            "i'd like to go to", "i'd like to go", "i'd like",
-            "i will go with", "i'll go with", "go with", "take"
-        ]
-        decision_requested = any(
-            phrase in message for phrase in decision_phrases)
-        selected_station_name = self._extract_station_name(message)
+        message = _normalized_message(tracker)
+        decision_requested = bool(_DECISION_PHRASE_RE.search(message))
+        selected_station_name = _extract_station_name(message)
 
         if not selected_station_name:
-            dispatcher.utter_message(
-                text=(
-                    "❌ I couldn't extract a station from your message. "
-                    "It might not be in the dataset or was unclear. Try the exact name shown above, e.g., 'Lynbrook Village'."
-                )
-            )
+            dispatcher.utter_message(text=ErrorMessages.STATION_NOT_EXTRACTED)
             return []
 
         start_location = tracker.get_slot("start_location")
         end_location = tracker.get_slot("end_location")
 
         try:
-            stations = data_service.get_route_stations(
-                start_location, end_location)
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_route_stations(start_location, end_location))
             if stations:
                 # Prefer the stations we actually displayed
                 displayed = tracker.get_slot("displayed_stations") or []
                 selected_station = None
+                # Normalise the typed name and every route station name once per turn
+                selected_name = self._normalize_station_name(selected_station_name)
+                normalized = [(self._normalize_station_name(st.get('name')), st) for st in stations]
                 # Try match against displayed snapshot first
                 if displayed:
                     for s in displayed:
                         name = self._normalize_station_name(s.get('name'))
-                        selected_name = self._normalize_station_name(selected_station_name)
 
                         if selected_name in name or name in selected_name:
                             # find full station dict from current stations by name
-                            selected_station = next((st for st in stations if (
-                                self._normalize_station_name(st.get('name', '')) == name)), None)
+                            selected_station = next(
+                                (st for st_name, st in normalized if st_name == name), None)
 
                             if not selected_station:
-                                 # fallback to first partial match
-                                  selected_station = next(
-                                        (st for st in stations if name in self._normalize_station_name(st.get('name', ''))), None)
-                                        
+                                # fallback to first partial match
+                                selected_station = next(
+                                    (st for st_name, st in normalized if name in st_name), None)
+
                             break
                 if not selected_station:
-                  for station in stations:
-                    station_name = self._normalize_station_name(station.get('name'))
-                    selected_name = self._normalize_station_name(selected_station_name)
-
-                    if selected_name in station_name or station_name in selected_name:
-                      selected_station = station
-                      break
+                    selected_station = next(
+                        (st for st_name, st in normalized
+                         if selected_name in st_name or st_name in selected_name), None)
 
                 if selected_station:
                     if decision_requested:
                         # Directly provide directions and trigger traffic when possible
-                        current_location = tracker.get_slot("current_location")
-                        origin_for_link = start_location or current_location or "My Location"
-                        maps_link = ActionAdvancedDirections()._build_maps_link(
-                            origin_for_link,
-                            selected_station.get(
-                                'address') or selected_station.get('name')
-                        )
-                        response = (
-                            f"🧭 **Directions**\n\n"
-                            f"Start: {origin_for_link}\n"
-                            f"Destination: {selected_station.get('name')}\n\n"
-                            f"🔗 {maps_link}"
-                        )
-                        dispatcher.utter_message(text=response)
-                        from rasa_sdk.events import FollowupAction
-                        events = [
-                            SlotSet("selected_station",
-                                    selected_station.get('name')),
-                            SlotSet("end_location",
-                                    selected_station.get('name')),
-                            SlotSet("conversation_context", None),
-                        ]
-                        # Persist a concrete origin if we have one (avoid hardcoding defaults)
-                        if start_location:
-                            events.append(
-                                SlotSet("start_location", start_location))
-                        elif current_location:
-                            events.append(
-                                SlotSet("start_location", current_location))
-                        # Trigger traffic only if both origin and destination are known
-                        if start_location or current_location:
-                            events.append(FollowupAction(
-                                "action_traffic_info"))
-                        return events
+                        return self._direct_to_station(
+                            dispatcher, selected_station,
+                            start_location or tracker.get_slot("current_location"))
                     else:
                         return self._display_station_details(dispatcher, selected_station, start_location, end_location)
                 else:
                     # Provide a dataset-aware explanation instead of robotic repeat
-                    displayed_names = ", ".join(
-                        [s.get('name') for s in (
-                            tracker.get_slot("displayed_stations") or [])]
-                    ) or "the list above"
-                    dispatcher.utter_message(
-                        text=(
-                            "❌ I couldn't find that station in the dataset for this route. "
-                            f"Please choose one of: {displayed_names}."
-                        )
-                    )
+                    dispatcher.utter_message(text=ErrorMessages.STATION_NOT_ON_ROUTE.format_map(
+                        {'names': _displayed_station_names(tracker)}))
                     return []
             else:
                 dispatcher.utter_message(
@@ -1552,62 +1504,36 @@ class ActionHandleRouteStationSelection(Action):
                 return []
 
         except Exception as e:
-            print(f"Error in station selection: {e}")
+            logger.error("Error in station selection: %s", e)
             dispatcher.utter_message(
-                text="Unable to process station selection. Please try again.")
+                text=ErrorMessages.STATION_SELECTION)
             return []
 
     def _normalize_station_name(self, text: str) -> str:
-        text = (text or "").lower().strip()
-        text = text.replace("centre", "center")
-        text = text.replace("&", "and")
-        text = text.replace("-", " ")
-        text = " ".join(text.split())
-        return text
-
-    def _extract_station_name(self, message: str) -> Optional[str]:
-        message = message.strip()
-        if len(message) > 2:
-            return message
-        return None
+        text = _STATION_NAME_SUB_RE.sub(lambda m: _STATION_NAME_SUBS[m.group()], (text or "").lower())
+        return " ".join(text.split())
 
     def _display_station_details(self, dispatcher: CollectingDispatcher, station_details: Dict, start_location: str, end_location: str) -> List[Dict[Text, Any]]:
         """Display detailed station information and next action options"""
-        response = f"🎯 **{station_details['name']}**\n\n"
-        response += f"📍 **Address:** {station_details.get('address', 'Address available')}\n"
-        response += f"⚡ **Power:** {station_details.get('power', 'Power info available')} charging\n"
-        response += f"💰 **Cost:** {station_details.get('cost', 'Cost info available')}\n"
-        response += f"🕐 **Charging time:** {station_details.get('charging_time', 'Time estimate available')}\n"
-        response += f"🔌 **Available points:** {station_details.get('points', 'Point info available')}\n\n"
-
-        response += "**🎯 What would you like to do next?**\n\n"
-        response += "• Type 'get directions' to this station 🧭\n"
-        response += "• Type 'compare options' 📊\n"
-        response += "• Type 'check availability' ✅"
-
-        dispatcher.utter_message(text=response)
-        return [
-            SlotSet("conversation_context",
-                    ConversationContexts.STATION_DETAILS),
-            SlotSet("selected_station", station_details.get('name'))
-        ]
+        return self._show_station_details(
+            dispatcher, station_details, f"🎯 **{station_details['name']}**\n\n")
 
 
-class ActionHandleEmergencyStationSelection(Action):
+class ActionHandleEmergencyStationSelection(_StationSelectionAction):
     def name(self) -> Text:
         return "action_handle_emergency_station_selection"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
-        if conversation_context not in [ConversationContexts.EMERGENCY_CHARGING, ConversationContexts.EMERGENCY_RESULTS]:
+        if conversation_context not in _EMERGENCY_CONTEXTS:
             return []
 
-        message = tracker.latest_message.get('text', '').lower().strip()
-        selected_station_name = self._extract_station_name(message)
+        message = _normalized_message(tracker)
+        selected_station_name = _extract_station_name(message)
 
         if not selected_station_name:
             dispatcher.utter_message(
-                text="Please type the station name from the list above.")
+                text=Messages.TYPE_STATION_NAME)
             return []
 
         current_location = tracker.get_slot("current_location")
@@ -1617,70 +1543,42 @@ class ActionHandleEmergencyStationSelection(Action):
                 text="❌ I need your location to proceed. Please type your suburb (e.g., 'Richmond').")
             return []
 
-        stations = data_service.get_emergency_stations(current_location)
+        stations = await asyncio.to_thread(
+            lambda: get_data_service().get_emergency_stations(current_location))
         if stations:
-            selected_station = None
-            station_index = None
-
-            for i, station in enumerate(stations):
-                if selected_station_name.lower() in station.get('name', '').lower():
-                    selected_station = station
-                    station_index = i + 1
-                    break
+            selected_station, station_index = _find_station_by_name(stations, selected_station_name)
 
             if selected_station:
                 return self._display_emergency_station_details(dispatcher, selected_station, station_index, current_location)
             else:
                 dispatcher.utter_message(
-                    text="Station not found. Please type the exact station name from the list above.")
+                    text=Messages.TYPE_EXACT_STATION_NAME)
                 return []
         else:
             dispatcher.utter_message(
                 text="No emergency stations found. Please try a different location.")
             return []
 
-    def _extract_station_name(self, message: str) -> Optional[str]:
-        message = message.strip()
-        if len(message) > 2:
-            return message
-        return None
-
     def _display_emergency_station_details(self, dispatcher: CollectingDispatcher, selected_station: Dict, station_index: int, current_location: str) -> List[Dict[Text, Any]]:
-        response = f"🚨 **Emergency Station {station_index}: {selected_station['name']}**\n\n"
-        response += f"📍 **Address:** {selected_station.get('address', 'Address available')}\n"
-        response += f"⚡ **Power:** {selected_station.get('power', 'Power info available')} charging\n"
-        response += f"💰 **Cost:** {selected_station.get('cost', 'Cost info available')}\n"
-        response += f"🕐 **Charging time:** {selected_station.get('charging_time', 'Time estimate available')}\n"
-        response += f"🔌 **Available points:** {selected_station.get('points', 'Point info available')}\n\n"
-
-        response += "**🎯 What would you like to do next?**\n\n"
-        response += "• Type 'get directions' to this station 🧭\n"
-        response += "• Type 'compare options' 📊\n"
-        response += "• Type 'check availability' ✅"
-
-        dispatcher.utter_message(text=response)
-        return [
-            SlotSet("conversation_context",
-                    ConversationContexts.STATION_DETAILS),
-            SlotSet("selected_station", selected_station.get('name'))
-        ]
+        return self._show_station_details(
+            dispatcher, selected_station, f"🚨 **Emergency Station {station_index}: {selected_station['name']}**\n\n")
 
 
-class ActionHandlePreferenceStationSelection(Action):
+class ActionHandlePreferenceStationSelection(_StationSelectionAction):
     def name(self) -> Text:
         return "action_handle_preference_station_selection"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
-        if conversation_context not in [ConversationContexts.PREFERENCE_CHARGING, ConversationContexts.PREFERENCE_RESULTS]:
+        if conversation_context not in _PREFERENCE_CONTEXTS:
             return []
 
-        message = tracker.latest_message.get('text', '').lower().strip()
-        selected_station_name = self._extract_station_name(message)
+        message = _normalized_message(tracker)
+        selected_station_name = _extract_station_name(message)
 
         if not selected_station_name:
             dispatcher.utter_message(
-                text="Please type the station name from the list above.")
+                text=Messages.TYPE_STATION_NAME)
             return []
 
         preference = tracker.get_slot("charging_preference")
@@ -1691,145 +1589,87 @@ class ActionHandlePreferenceStationSelection(Action):
                 text="❌ Missing preference or location. Please start over.")
             return []
 
-        try:
-            # Check if location is already GPS coordinates
-            if isinstance(location, str) and location.startswith('(') and location.endswith(')'):
-                # Extract coordinates from string format "(lat, lng)"
-                try:
-                    lat_str, lng_str = location.strip('()').split(',')
-                    coords = (float(lat_str.strip()), float(lng_str.strip()))
-                except:
-                    dispatcher.utter_message(
-                        text=f"❌ Invalid location format: {location}")
-                    return []
-            else:
-                # Try to convert text location to coordinates
-                coords = data_service._get_location_coordinates(location)
-                if not coords:
-                    dispatcher.utter_message(
-                        text=f"❌ I can't find charging stations in {location}.")
-                    return []
-
-            stations = data_service.get_stations_by_preference(
-                coords, preference)
-            if stations:
-                selected_station = None
-                station_index = None
-
-                for i, station in enumerate(stations):
-                    if selected_station_name.lower() in station.get('name', '').lower():
-                        selected_station = station
-                        station_index = i + 1
-                        break
-
-                if selected_station:
-                    # Directly provide directions, then trigger real-time traffic if possible
-                    current_location = tracker.get_slot("current_location")
-                    origin_for_link = current_location or tracker.get_slot(
-                        "start_location") or "My Location"
-                    maps_link = ActionAdvancedDirections()._build_maps_link(
-                        origin_for_link,
-                        selected_station.get(
-                            'address') or selected_station.get('name')
-                    )
-                    response = (
-                        f"🧭 **Directions**\n\n"
-                        f"Start: {origin_for_link}\n"
-                        f"Destination: {selected_station.get('name')}\n\n"
-                        f"🔗 {maps_link}"
-                    )
-                    dispatcher.utter_message(text=response)
-                    from rasa_sdk.events import FollowupAction
-                    events: List[Dict[Text, Any]] = [
-                        SlotSet("selected_station",
-                                selected_station.get('name')),
-                        SlotSet("end_location", selected_station.get('name')),
-                        SlotSet("start_location", current_location or tracker.get_slot(
-                            "start_location")),
-                        SlotSet("conversation_context", None),
-                    ]
-                    if current_location or tracker.get_slot("start_location"):
-                        events.append(FollowupAction("action_traffic_info"))
-                    return events
-                else:
-                    dispatcher.utter_message(
-                        text="Station not found. Please type the exact station name from the list above.")
-                    return []
-            else:
+        coords = None
+        # Check if location is already GPS coordinates
+        if isinstance(location, str) and location.startswith('(') and location.endswith(')'):
+            # Extract coordinates from string format "(lat, lng)"
+            lat_str, _, lng_str = location.strip('()').partition(',')
+            try:
+                coords = (float(lat_str), float(lng_str))
+            except ValueError:
                 dispatcher.utter_message(
-                    text="No preference-based stations found. Please try a different location.")
+                    text=f"❌ Invalid location format: {location}")
                 return []
 
-        except Exception as e:
-            print(f"Error in preference station selection: {e}")
+        try:
+            if coords is None:
+                # Try to convert text location to coordinates
+                coords = await asyncio.to_thread(
+                    lambda: get_data_service()._get_location_coordinates(location))
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_stations_by_preference(coords, preference)) if coords else []
+        except (OSError, ValueError, KeyError) as e:
+            # Network and data failures only; OSError covers socket and requests errors
+            logger.error("Error in preference station selection: %s", e)
             dispatcher.utter_message(
-                text="Unable to process station selection. Please try again.")
+                text=ErrorMessages.STATION_SELECTION)
             return []
 
-    def _extract_station_name(self, message: str) -> Optional[str]:
-        message = message.strip()
-        if len(message) > 2:
-            return message
-        return None
+        if not coords:
+            dispatcher.utter_message(
+                text=ErrorMessages.LOCATION_NOT_FOUND.format_map({'location': location}))
+            return []
+        if not stations:
+            dispatcher.utter_message(
+                text="No preference-based stations found. Please try a different location.")
+            return []
 
-    def _display_preference_station_details(self, dispatcher: CollectingDispatcher, selected_station: Dict, station_index: int, location: str, preference: str) -> List[Dict[Text, Any]]:
-        response = f"⚡ **{preference.title()} Station {station_index}: {selected_station['name']}**\n\n"
-        response += f"📍 **Address:** {selected_station.get('address', 'Address available')}\n"
-        response += f"⚡ **Power:** {selected_station.get('power', 'Power info available')} charging\n"
-        response += f"💰 **Cost:** {selected_station.get('cost', 'Cost info available')}\n"
-        response += f"🕐 **Charging time:** {selected_station.get('charging_time', 'Time estimate available')}\n"
-        response += f"🔌 **Available points:** {selected_station.get('points', 'Point info available')}\n\n"
+        selected_station, _ = _find_station_by_name(stations, selected_station_name)
+        if not selected_station:
+            dispatcher.utter_message(
+                text=Messages.TYPE_EXACT_STATION_NAME)
+            return []
 
-        response += "**🎯 What would you like to do next?**\n\n"
-        response += "• Type 'get directions' to this station 🧭\n"
-        response += "• Type 'compare options' 📊\n"
-        response += "• Type 'check availability' ✅"
-
-        dispatcher.utter_message(text=response)
-        return [
-            SlotSet("conversation_context",
-                    ConversationContexts.STATION_DETAILS),
-            SlotSet("selected_station", selected_station.get('name'))
-        ]
+        # Directly provide directions, then trigger real-time traffic if possible
+        return self._direct_to_station(dispatcher, selected_station, location)
 
 
 class ActionHandleActionChoice(Action):
     def name(self) -> Text:
         return "action_handle_action_choice"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
         if conversation_context != ConversationContexts.STATION_DETAILS:
             return []
 
-        message = tracker.latest_message.get('text', '').lower().strip()
-        choice = None
-
-        if any(word in message for word in ['compare', 'comparison', 'other', 'options']):
-            choice = "compare"
-        elif any(word in message for word in ['availability', 'available', 'status', 'check']):
-            choice = "availability"
+        message = _normalized_message(tracker)
+        choice = _ACTION_CHOICE_BY_NUMBER.get(message)
+        if choice is None:
+            choice = next(
+                (action for action, pattern in _ACTION_CHOICE_PATTERNS if pattern.search(message)), None)
 
-        if choice == "compare":
-            return self._show_comparison(dispatcher, tracker)
-        elif choice == "availability":
-            self._show_availabilty(dispatcher, tracker)
+        if choice == ActionTypes.COMPARE_OPTIONS:
+            return await self._show_comparison(dispatcher, tracker)
+        elif choice == ActionTypes.CHECK_AVAILABILITY:
+            await self._show_availabilty(dispatcher, tracker)
 
             return [SlotSet("conversation_context", ConversationContexts.ENDED)]
         else:
-            dispatcher.utter_message(
-                text="Please type one of: 'get directions', 'compare options', or 'check availability'")
+            dispatcher.utter_message(text=Messages.ACTION_CHOICE_HELP)
             return []
 
-    def _show_comparison(self, dispatcher: CollectingDispatcher, tracker: Tracker) -> List[Dict[Text, Any]]:
+    async def _show_comparison(self, dispatcher: CollectingDispatcher, tracker: Tracker) -> List[Dict[Text, Any]]:
         start_location = tracker.get_slot("start_location")
         end_location = tracker.get_slot("end_location")
         displayed = tracker.get_slot("displayed_stations") or []
 
         stations_to_compare: List[Dict[str, Any]] = []
         try:
-            route_stations = data_service.get_route_stations(
-                start_location, end_location) if start_location and end_location else []
+            route_stations = []
+            if start_location and end_location:
+                route_stations = await asyncio.to_thread(
+                    lambda: get_data_service().get_route_stations(start_location, end_location))
             # Map by lowercased name for quick lookup
             by_name = {(s.get('name') or '').lower()
                         : s for s in route_stations}
@@ -1847,7 +1687,7 @@ class ActionHandleActionChoice(Action):
                     if len(stations_to_compare) >= 5:
                         break
         except Exception as e:
-            print(f"Compare options error: {e}")
+            logger.error("Compare options error: %s", e)
 
         if not stations_to_compare:
             dispatcher.utter_message(
@@ -1868,7 +1708,7 @@ class ActionHandleActionChoice(Action):
         dispatcher.utter_message(text="\n".join(lines))
         return [SlotSet("conversation_context", ConversationContexts.STATION_DETAILS)]
 
-    def _show_availabilty(self, dispatcher: CollectingDispatcher, tracker: Tracker) -> List[Dict[Text, Any]]:
+    async def _show_availabilty(self, dispatcher: CollectingDispatcher, tracker: Tracker) -> List[Dict[Text, Any]]:
 
         # Prefer selected station coordinates when available; otherwise use stored user location
         lat = None
@@ -1892,29 +1732,25 @@ class ActionHandleActionChoice(Action):
                 text=f"I need a location to check availability.")
             return []
 
-        status, updated_at, data = data_service._get_station_availability(
-            float(lat), float(lng))
+        status, updated_at, data = await asyncio.to_thread(
+            lambda: get_data_service()._get_station_availability(float(lat), float(lng)))
 
         # Guard against non-dict payloads (e.g., string errors)
         if not isinstance(data, dict):
-            msg = f"🔌 **Station Availability:** {status}\n"
-            if isinstance(data, str) and data.strip():
-                msg += data.strip()
-            else:
-                msg += "No additional availability details available."
-            dispatcher.utter_message(text=msg)
+            detail = data.strip() if isinstance(data, str) else ''
+            dispatcher.utter_message(
+                text=f"🔌 **Station Availability:** {status}\n"
+                     f"{detail or 'No additional availability details available.'}")
             return []
 
-        msg = f"🔌 **Station Availability:**\n"
         connectors = data.get('connectors', [])
         if not connectors:
             info = data.get('raw')
-            if isinstance(info, str) and info.strip():
-                msg += info.strip()
-            else:
-                msg += f"{status}"
-            dispatcher.utter_message(text=msg)
+            detail = info.strip() if isinstance(info, str) else ''
+            dispatcher.utter_message(
+                text=f"🔌 **Station Availability:**\n{detail or status}")
             return []
+        parts = ["🔌 **Station Availability:**\n"]
         for conn in connectors:
             conn_type = conn.get('type', 'Unknown')
             total = conn.get('total', 0)
@@ -1924,7 +1760,7 @@ class ActionHandleActionChoice(Action):
             reserved = current.get('reserved', 0)
             unknown = current.get('unknown', 0)
             out_of_service = current.get('outOfService', 0)
-            msg += (
+            parts.append(
                 f"\n• **{conn_type}** (Total: {total})\n"
                 f"   - Available: {available}\n"
                 f"   - Occupied: {occupied}\n"
@@ -1936,7 +1772,7 @@ class ActionHandleActionChoice(Action):
             per_power = conn.get('availability', {}).get('perPowerLevel', [])
             for p in per_power:
                 power_kw = p.get('powerKW', '')
-                msg += (
+                parts.append(
                     f"   - Power: {power_kw} kW | "
                     f"Available: {p.get('available', 0)}, "
                     f"Occupied: {p.get('occupied', 0)}, "
@@ -1945,7 +1781,7 @@ class ActionHandleActionChoice(Action):
                     f"Out of Service: {p.get('outOfService', 0)}\n"
                 )
 
-        dispatcher.utter_message(text=msg)
+        dispatcher.utter_message(text="".join(parts))
         return []
 
 
@@ -1953,19 +1789,18 @@ class ActionHandleFollowUp(Action):
     def name(self) -> Text:
         return "action_handle_follow_up"
 
+    _STATUS_BY_CONTEXT = {
+        ConversationContexts.GETTING_DIRECTIONS: "🗺️ Directions are being calculated...",
+        ConversationContexts.COMPARING_STATIONS: "📊 Station comparison in progress...",
+        ConversationContexts.CHECKING_AVAILABILITY: "✅ Checking availability...",
+    }
+    _DEFAULT_STATUS = "How can I help you further?"
+
     def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
 
-        if conversation_context == ConversationContexts.GETTING_DIRECTIONS:
-            dispatcher.utter_message(
-                text="🗺️ Directions are being calculated...")
-        elif conversation_context == ConversationContexts.COMPARING_STATIONS:
-            dispatcher.utter_message(
-                text="📊 Station comparison in progress...")
-        elif conversation_context == ConversationContexts.CHECKING_AVAILABILITY:
-            dispatcher.utter_message(text="✅ Checking availability...")
-        else:
-            dispatcher.utter_message(text="How can I help you further?")
+        dispatcher.utter_message(
+            text=self._STATUS_BY_CONTEXT.get(conversation_context, self._DEFAULT_STATUS))
 
         return []
 
@@ -1974,7 +1809,7 @@ class ActionAdvancedDirections(Action):
     def name(self) -> Text:
         return "action_advanced_directions"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Provide directions and traffic-aware ETA using real-time integration if available."""
         start_location = tracker.get_slot("start_location")
         end_location = tracker.get_slot("end_location")
@@ -1996,9 +1831,8 @@ class ActionAdvancedDirections(Action):
         # Try real-time enhanced route planning
         if REAL_TIME_INTEGRATION_AVAILABLE and real_time_manager:
             try:
-                real_time_data = real_time_manager.get_enhanced_route_planning(
-                    start_location, end_location
-                )
+                real_time_data = await asyncio.to_thread(
+                    lambda: real_time_manager.get_enhanced_route_planning(start_location, end_location))
 
                 if real_time_data and real_time_data.get("success"):
                     route_info = real_time_data.get("route_info") or {}
@@ -2028,8 +1862,8 @@ class ActionAdvancedDirections(Action):
                         pass
 
                     logger.info(
-                        f"Directions computed: {start_location} → {end_location} | "
-                        f"distance_km={distance_km} | duration_min={duration_min} | delay_min={delay_min}"
+                        "Directions computed: %s → %s | distance_km=%s | duration_min=%s | delay_min=%s",
+                        start_location, end_location, distance_km, duration_min, delay_min
                     )
 
                     response_parts: List[str] = []
@@ -2071,7 +1905,7 @@ class ActionAdvancedDirections(Action):
                     ]
 
             except Exception as e:
-                print(f"Error in ActionAdvancedDirections real-time flow: {e}")
+                logger.error("Error in ActionAdvancedDirections real-time flow: %s", e)
 
         dispatcher.utter_message(
             text=(
@@ -2109,7 +1943,7 @@ class ActionTrafficInfo(Action):
     def name(self) -> Text:
         return "action_traffic_info"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         """Provide live traffic conditions for the current or selected route."""
         start_location = tracker.get_slot("start_location")
         end_location = tracker.get_slot("end_location")
@@ -2128,14 +1962,12 @@ class ActionTrafficInfo(Action):
             return []
 
         # Show "your current location" instead of raw GPS coordinates
-        import re as _re
-        start_label = "your current location" if _re.match(r'^\(?\s*-?\d+\.\d+\s*,\s*-?\d+\.\d+\s*\)?$', str(start_location).strip()) else start_location
+        start_label = "your current location" if _COORD_PAIR_RE.match(str(start_location).strip()) else start_location
 
         if REAL_TIME_INTEGRATION_AVAILABLE and real_time_manager:
             try:
-                traffic = real_time_manager.get_traffic_conditions(
-                    start_location, end_location
-                )
+                traffic = await asyncio.to_thread(
+                    lambda: real_time_manager.get_traffic_conditions(start_location, end_location))
                 if traffic:
                     status = traffic.get("traffic_status", "Unknown")
                     congestion = traffic.get("congestion_level")
@@ -2155,11 +1987,11 @@ class ActionTrafficInfo(Action):
                             f"• Speed: {int(current_speed)} km/h (free-flow {int(free_flow_speed)} km/h)"
                         )
 
+                    details.append(f"\n{Messages.GOODBYE}")
                     dispatcher.utter_message(text="\n".join(details))
-                    dispatcher.utter_message(text=Messages.GOODBYE)
                     return [SlotSet("conversation_context", ConversationContexts.ENDED)]
             except Exception as e:
-                print(f"Error in ActionTrafficInfo: {e}")
+                logger.error("Error in ActionTrafficInfo: %s", e)
 
         dispatcher.utter_message(
             text=f"🚦 Real-time traffic to {end_location} is unavailable right now.\n\n"
@@ -2171,7 +2003,7 @@ class ActionEnhancedChargerInfo(Action):
     def name(self) -> Text:
         return "action_enhanced_charger_info"
 
-    def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
+    async def run(self, dispatcher: CollectingDispatcher, tracker: Tracker, domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
         selected_station = tracker.get_slot("selected_station")
 
         if not selected_station:
@@ -2181,26 +2013,28 @@ class ActionEnhancedChargerInfo(Action):
             return []
 
         try:
-            details = data_service.get_station_details(selected_station)
+            details = await asyncio.to_thread(
+                lambda: get_data_service().get_station_details(selected_station))
             if not details:
                 dispatcher.utter_message(
                     text=f"❌ I couldn't find details for '{selected_station}'. Please pick another station."
                 )
                 return []
 
+            # get_station_details fills every field with its own fallback text
             response = (
-                f"🔌 **{details.get('name', selected_station)}**\n\n"
-                f"📍 **Address:** {details.get('address', 'Address available')}\n"
-                f"⚡ **Power:** {details.get('power', 'Power info available')}\n"
-                f"🔌 **Points:** {details.get('points', 'Points info available')}\n"
-                f"💰 **Cost:** {details.get('cost', 'Cost info available')}\n"
-                f"🕐 **Charging time:** {details.get('charging_time', 'Time estimate available')}\n"
+                f"🔌 **{details['name']}**\n\n"
+                f"📍 **Address:** {details['address']}\n"
+                f"⚡ **Power:** {details['power']}\n"
+                f"🔌 **Points:** {details['points']}\n"
+                f"💰 **Cost:** {details['cost']}\n"
+                f"🕐 **Charging time:** {details['charging_time']}\n"
             )
 
             dispatcher.utter_message(text=response)
             return []
         except Exception as e:
-            print(f"Error in ActionEnhancedChargerInfo: {e}")
+            logger.error("Error in ActionEnhancedChargerInfo: %s", e)
             dispatcher.utter_message(
                 text="❌ Unable to fetch charger details right now."
             )
@@ -2210,7 +2044,7 @@ class ActionEnhancedPreferenceFiltering(Action):
     def name(self) -> Text:
         return "action_enhanced_preference_filtering"
 
-    def run(
+    async def run(
         self,
         dispatcher: CollectingDispatcher,
         tracker: Tracker,
@@ -2218,30 +2052,21 @@ class ActionEnhancedPreferenceFiltering(Action):
     ) -> List[Dict[Text, Any]]:
         conversation_context = tracker.get_slot("conversation_context")
 
-        if conversation_context in [
-            ConversationContexts.ROUTE_PLANNING_RESULTS,
-            ConversationContexts.STATION_DETAILS,
-        ]:
+        if conversation_context in _ROUTE_SELECTION_CONTEXTS:
             try:
-                return ActionHandleRouteStationSelection().run(dispatcher, tracker, domain)
+                return await ActionHandleRouteStationSelection().run(dispatcher, tracker, domain)
             except Exception as e:
-                print(f"Error forwarding to route station selection from preference filter action: {e}")
+                logger.error("Error forwarding to route station selection from preference filter action: %s", e)
                 return []
 
-        if conversation_context in [
-            ConversationContexts.EMERGENCY_RESULTS,
-            ConversationContexts.EMERGENCY_CHARGING,
-        ]:
+        if conversation_context in _EMERGENCY_CONTEXTS:
             try:
-                return ActionHandleEmergencyStationSelection().run(dispatcher, tracker, domain)
+                return await ActionHandleEmergencyStationSelection().run(dispatcher, tracker, domain)
             except Exception as e:
-                print(f"Error forwarding to emergency station selection from preference filter action: {e}")
+                logger.error("Error forwarding to emergency station selection from preference filter action: %s", e)
                 return []
 
-        if conversation_context in [
-            ConversationContexts.PREFERENCE_CHARGING,
-            ConversationContexts.PREFERENCE_RESULTS,
-        ]:
+        if conversation_context in _PREFERENCE_CONTEXTS:
             dispatcher.utter_message(
                 text=(
                     "❌ Preference-based filtering is unavailable right now. "
@@ -2257,47 +2082,33 @@ class ActionContextualHelp(Action):
     def name(self):
         return "action_contextual_help"
 
+    # Help text per journey context, resolved with one dict lookup per turn
+    _HELP_BY_CONTEXT = {
+        ConversationContexts.ROUTE_PLANNING: "You are currently in route planning. Please provide your starting location and destination so I can help find suitable EV charging stations for your trip.",
+        ConversationContexts.EMERGENCY_CHARGING: "You are currently using emergency charging support. Please provide your current location and charger type so I can help find nearby charging options.",
+        ConversationContexts.PREFERENCE_CHARGING: "You are currently using preference-based charging. You can choose options such as cheapest, fastest, or premium charging stations.",
+    }
+    _DEFAULT_HELP = "I can help you with EV route planning, nearby charging stations, emergency charging, traffic information, and directions. You can type 'plan a route', 'find a charger', or 'explain route planning'."
+
     def run(self, dispatcher, tracker, domain):
         context = tracker.get_slot("conversation_context")
 
-        if context == "route_planning":
-            dispatcher.utter_message(
-                text="You are currently in route planning. Please provide your starting location and destination so I can help find suitable EV charging stations for your trip."
-            )
-
-        elif context == "emergency_charging":
-            dispatcher.utter_message(
-                text="You are currently using emergency charging support. Please provide your current location and charger type so I can help find nearby charging options."
-            )
-
-        elif context == "preference_charging":
-            dispatcher.utter_message(
-                text="You are currently using preference-based charging. You can choose options such as cheapest, fastest, or premium charging stations."
-            )
-
-        else:
-            dispatcher.utter_message(
-                text="I can help you with EV route planning, nearby charging stations, emergency charging, traffic information, and directions. You can type 'plan a route', 'find a charger', or 'explain route planning'."
-            )
+        dispatcher.utter_message(
+            text=self._HELP_BY_CONTEXT.get(context, self._DEFAULT_HELP)
+        )
 
 
 class ActionNearbyStations(Action):
     def name(self) -> Text:
         return "action_nearby_stations"
 
-    def run(
+    async def run(
         self,
         dispatcher: CollectingDispatcher,
         tracker: Tracker,
         domain: Dict[Text, Any]
     ) -> List[Dict[Text, Any]]:
-        location = tracker.get_slot("current_location")
-
-        entities = tracker.latest_message.get("entities", []) or []
-        for ent in entities:
-            if ent.get("entity") == "current_location" and ent.get("value"):
-                location = ent.get("value")
-                break
+        location = _latest_entity(tracker, "current_location") or tracker.get_slot("current_location")
 
         user_lat = tracker.get_slot("user_lat")
         user_lng = tracker.get_slot("user_lng")
@@ -2306,11 +2117,14 @@ class ActionNearbyStations(Action):
 
         try:
             if location:
-                coords = data_service._get_location_coordinates(location)
+                coords = await asyncio.to_thread(
+                    lambda: get_data_service()._get_location_coordinates(location))
                 if coords:
-                    stations = data_service.get_emergency_stations_from_coordinates(coords)
+                    stations = await asyncio.to_thread(
+                        lambda: get_data_service().get_emergency_stations_from_coordinates(coords))
             elif user_lat is not None and user_lng is not None:
-                stations = data_service.get_emergency_stations_from_coordinates((user_lat, user_lng))
+                stations = await asyncio.to_thread(
+                    lambda: get_data_service().get_emergency_stations_from_coordinates((user_lat, user_lng)))
         except Exception as e:
             dispatcher.utter_message(text=f"Error finding nearby stations: {str(e)}")
             return []
@@ -2318,17 +2132,18 @@ class ActionNearbyStations(Action):
         if stations:
             _send_station_cards(dispatcher, stations, limit=5)
 
-            response = "Here are some nearby charging stations:\n\n"
+            parts = ["Here are some nearby charging stations:\n\n"]
             for i, station in enumerate(stations[:5], 1):
                 name = station.get("name", f"Station {i}")
                 dist = station.get("distance_km")
 
                 if isinstance(dist, (int, float)):
-                    response += f"{i}. {name} - {dist:.1f} km away\n"
+                    parts.append(f"{i}. {name} - {dist:.1f} km away\n")
                 else:
-                    response += f"{i}. {name}\n"
+                    parts.append(f"{i}. {name}\n")
 
-            response += "\nType the station name if you want more details."
+            parts.append("\nType the station name if you want more details.")
+            response = "".join(parts)
             dispatcher.utter_message(text=response)
 
             return [
@@ -2373,7 +2188,7 @@ class ActionCongestionPrediction(Action):
     def name(self) -> Text:
         return "action_congestion_prediction"
 
-    def run(self, dispatcher, tracker, domain):
+    async def run(self, dispatcher, tracker, domain):
 
         # Lấy location từ entity
         location = tracker.get_slot("location")
@@ -2422,20 +2237,19 @@ class ActionCongestionPrediction(Action):
         # ⭐ GỌI LẠI ROUTE PLANNING
         # ================================
         try:
-            stations = data_service.get_route_stations(
-                start_location,
-                location
-            )
+            stations = await asyncio.to_thread(
+                lambda: get_data_service().get_route_stations(start_location, location))
 
             if stations:
                 _send_station_cards(dispatcher, stations, limit=10)
 
-                response = f"⚡ Found {len(stations)} charging stations from **{start_location}** to **{location}**:\n\n"
-                for i, station in enumerate(stations[:5]):
-                    response += f"**{i+1}. {station.get('name')}**\n"
-                    response += f"⚡ {station.get('power')} | 💰 {station.get('cost')}\n\n"
-
-                response += "Type a station name to choose one."
+                parts = [f"⚡ Found {len(stations)} charging stations from **{start_location}** to **{location}**:\n\n"]
+                parts.extend(
+                    f"**{i}. {station.get('name')}**\n⚡ {station.get('power')} | 💰 {station.get('cost')}\n\n"
+                    for i, station in enumerate(stations[:5], 1)
+                )
+                parts.append("Type a station name to choose one.")
+                response = "".join(parts)
 
                 dispatcher.utter_message(text=response)
 
@@ -37,12 +37,16 @@ SEARCH_CONFIG = {
     'PREFERENCE_PREFILTER_KM': 10.0,
     'MAX_RESULTS': 5,
     'EMERGENCY_MAX_RESULTS': 2,
+    'ROUTING_CONCURRENCY': 8,  # Parallel TomTom road-distance lookups per search
+    'STATION_NAME_MATCH_CUTOFF': 0.8,  # difflib ratio for accepting a misspelt station name
+    'SPATIAL_INDEX_MIN_STATIONS': 1000,  # Below this a vectorised scan beats a KD-tree query
 }
 
 # Location Configuration
 LOCATION_CONFIG = {
     'EARTH_RADIUS_KM': 6371,  # Scientific constant
     'COORDINATE_PRECISION': 6,  # Decimal places for coordinates
+    'COORDINATE_CACHE_SIZE': 2048,  # Memoized suburb/address lookups
 }
 
 # Cache Configuration
@@ -50,6 +54,10 @@ CACHE_CONFIG = {
     'DEFAULT_DURATION_SECONDS': 300,  # 5 minutes
     'LOCATION_CACHE_DURATION': 3600,  # 1 hour
     'STATION_CACHE_DURATION': 1800,   # 30 minutes
+    'ROUTE_STATIONS_CACHE_DURATION': 120,  # Follow-up turns re-read the same route
+    'EMERGENCY_STATIONS_CACHE_DURATION': 60,  # Selection turns re-read the same list
+    'PREFERENCE_STATIONS_CACHE_DURATION': 120,  # Selection turns re-rank the same location
+    'MAX_CACHED_RESULTS': 256,
 }
 
 # API Configuration (for future TomTom integration)
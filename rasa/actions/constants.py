@@ -63,9 +63,60 @@ class Messages:
     ACTION_CHOICE_PROMPT = "\n1. Get directions to this station\n2. Compare with other options\n3. Check current availability"
     GOODBYE = "Goodbye! Have a great journey! 🚗⚡"
 
+    # Fully rendered replies reused across dispatchers, built once at import
+    LOCATION_DETECTED = (
+        "✅ **Location detected!** Now I can help you find the best charging options.\n\n"
+        + MAIN_MENU
+    )
+    GREETING_LOCATION_DETECTED = (
+        GREETING + "\n\n"
+        "✅ **Location detected!** Now I can help you find the best charging options.\n\n"
+        "Please select an option:\n\n"
+        "1. 🗺️ **Route Planning** - Plan charging stops for your journey\n"
+        "2. 🚨 **Emergency Charging** - Find nearest stations when battery is low\n"
+        "3. ⚡ **Charging Preferences** - Find stations by your preferences\n\n"
+        "🎯 Type 1, 2, or 3 to continue!"
+    )
+    GREETING_LOCATION_REQUEST = (
+        GREETING + "\n\n"
+        "📍 Please share your location or type your suburb name (e.g. Richmond) to get started."
+    )
+    ROUTE_PLANNING_INTRO = (
+        "🗺️ **Route Planning**\n\n" + ROUTE_PLANNING_PROMPT
+        + "\n\n💡 **Example:** 'from Carlton to Geelong'"
+    )
+    EMERGENCY_INTRO = (
+        "🚨 **Emergency Charging**\n\n" + EMERGENCY_PROMPT
+        + "\n\n💡 **Example:** 'Richmond'"
+    )
+    PREFERENCE_INTRO = (
+        "⚡ **Charging Preferences**\n\n" + PREFERENCE_PROMPT
+        + "\n\n• Cheapest 💰\n• Fastest ⚡\n• Premium 🌟"
+    )
+    ROUTE_FORMAT_HELP = "🗺️ **Route Planning**\n\nProvide your route: 'from [start] to [destination]'"
+    NO_STORED_LOCATION = "❌ I don't have your current location stored.\n\nPlease share your location first."
+    TYPE_EXACT_STATION_NAME = "Station not found. Please type the exact station name from the list above."
+    TYPE_STATION_NAME = "Please type the station name from the list above."
+    ACTION_CHOICE_HELP = "Please type one of: 'get directions', 'compare options', or 'check availability'"
+
 
 class ErrorMessages:
     LOCATION_NOT_FOUND = "❌ I can't find charging stations in {location}."
     NO_STATIONS_FOUND = "❌ No charging stations found in your area."
     UNCLEAR_RESPONSE = "I'm not sure what you'd like to do. Please choose from the options above."
     INVALID_SELECTION = "Please choose a valid option (1, 2, or 3)."
+    ROUTE_PROCESSING = (
+        "❌ **Error processing route**\n\n"
+        "Please try again or use the format: 'from [start] to [destination]'"
+    )
+    STATION_SELECTION = "Unable to process station selection. Please try again."
+    UNKNOWN_DESTINATION = (
+        "❌ I couldn't determine a destination. "
+        "This can happen if the station name isn't in the dataset or wasn't clear. "
+    )
+    STATION_NOT_EXTRACTED = (
+        "❌ I couldn't extract a station from your message. "
+        "It might not be in the dataset or was unclear. Try the exact name shown above, e.g., 'Lynbrook Village'."
+    )
+    STATION_NOT_IN_LIST = "❌ I can't match that to a station from the current list. Please type one of: {names}."
+    STATION_NOT_ON_ROUTE = "❌ I couldn't find that station in the dataset for this route. Please choose one of: {names}."
@@ -4,37 +4,162 @@ Loads and provides access to charging station data from CSV datasets
 Uses ONLY data available in charger_info_mel.csv 
 """
 
+import numpy as np
 import pandas as pd
 import os
+import difflib
+import heapq
+from bisect import bisect_right
 from typing import Dict, List, Tuple, Optional, Any
-from math import radians, sin, cos, sqrt, atan2
+from math import radians, sin, cos, sqrt, atan2, pi
 import logging
 import re
-from .config import CHARGING_CONFIG, SEARCH_CONFIG, LOCATION_CONFIG, DATA_CONFIG
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from .config import CHARGING_CONFIG, SEARCH_CONFIG, LOCATION_CONFIG, DATA_CONFIG, CACHE_CONFIG
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
 
 # Import real-time APIs for enhanced functionality
 try:
     import sys
     sys.path.append(os.path.join(
         os.path.dirname(__file__), '..', '..', 'backend'))
-    from real_time_apis import api_manager
+    from real_time_apis import get_api_manager
     REAL_TIME_AVAILABLE = True
     logger = logging.getLogger(__name__)
     logger.info("Real-time APIs imported successfully")
 except ImportError as e:
     REAL_TIME_AVAILABLE = False
     logger = logging.getLogger(__name__)
-    logger.warning(f"Real-time APIs not available: {e}")
+    logger.warning("Real-time APIs not available: %s", e)
 
 logger = logging.getLogger(__name__)
 
+_EARTH_RADIUS_KM = float(LOCATION_CONFIG['EARTH_RADIUS_KM'])
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two (lat, lon) points given in degrees"""
+    lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
+    a = sin((lat2 - lat1) * 0.5)**2 + cos(lat1) * \
+        cos(lat2) * sin((lon2 - lon1) * 0.5)**2
+    return _EARTH_RADIUS_KM * 2.0 * atan2(sqrt(a), sqrt(1.0 - a))
+
+
+if njit is not None:
+    # Eager signature: compiled at import (and cached on disk), not on the first request.
+    # A read-only cache dir or a compile error must not stop the action server; keep pure Python
+    try:
+        _haversine_km = njit('float64(float64, float64, float64, float64)',
+                             cache=True, fastmath=True)(_haversine_km)
+    except Exception:
+        logger.debug("numba compile of _haversine_km failed; using pure Python", exc_info=True)
+
+
+def _haversine_km_to_many(lat: float, lon: float, lat_rad: np.ndarray, lon_rad: np.ndarray,
+                          cos_lat: np.ndarray) -> np.ndarray:
+    """Great-circle distances in km from one (lat, lon) in degrees to arrays of points in radians"""
+    lat1, lon1 = radians(lat), radians(lon)
+    a = np.sin((lat_rad - lat1) * 0.5)**2 + cos(lat1) * \
+        cos_lat * np.sin((lon_rad - lon1) * 0.5)**2
+    return _EARTH_RADIUS_KM * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+
+if njit is not None:
+    # Fuses the array expression into one loop without temporaries. Radius searches scan at
+    # most SPATIAL_INDEX_MIN_STATIONS rows before the KD-tree takes over, too few for
+    # parallel=True thread fan-out to pay off
+    try:
+        _haversine_km_to_many = njit('float64[:](float64, float64, float64[:], float64[:], float64[:])',
+                                     cache=True, fastmath=True)(_haversine_km_to_many)
+    except Exception:
+        logger.debug("numba compile of _haversine_km_to_many failed; using numpy", exc_info=True)
+
+
+def _station_distance(station: Dict[str, Any]) -> float:
+    return station.get('distance_km', 9999)
+
+
+# First number in a free-text field such as "AUD 0.30 per kWh" or "75, 22"
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
+
+@lru_cache(maxsize=1024)
+def _parse_cost(cost_str: str) -> float:
+    """First number in the cost string (e.g., "AUD 0.30 per kWh" -> 0.30); free is 0, unknown ranks last"""
+    match = _NUMBER_RE.search(cost_str)
+    if match:
+        return float(match.group())
+    if 'free' in cost_str.lower():
+        return 0.0
+    return 999.0
+
+
+@lru_cache(maxsize=1024)
+def _parse_power(power_str: str) -> float:
+    """First number in the power string (e.g., "75, 22" -> 75); higher power = faster charging"""
+    match = _NUMBER_RE.search(power_str)
+    return float(match.group()) if match else 0.0
+
+
+def _station_cost(station: Dict[str, Any]) -> float:
+    return _parse_cost(str(station.get('cost', '0')))
+
+
+def _station_power(station: Dict[str, Any]) -> float:
+    return _parse_power(str(station.get('power', '0')))
+
+
+# preference -> (sort key, descending); any other preference ranks by distance
+_PREFERENCE_SORT = {
+    "closest": (_station_distance, False),
+    "cheapest": (_station_cost, False),
+    "fastest": (_station_power, True),
+}
+
+# CHARGING_TIME_ESTIMATES ranges ordered by lower bound, for a bisect lookup (ranges are disjoint)
+_CHARGING_TIME_RANGES = sorted(CHARGING_CONFIG['CHARGING_TIME_ESTIMATES'].values())
+_CHARGING_TIME_MINS = [min_power for min_power, _, _ in _CHARGING_TIME_RANGES]
+
+
+def _charging_time_estimate(power: float) -> str:
+    """Time estimate of the range containing power; "Unknown" if it falls in a gap or outside them all"""
+    pos = bisect_right(_CHARGING_TIME_MINS, power) - 1
+    if pos < 0:
+        return "Unknown"
+    _, max_power, time_estimate = _CHARGING_TIME_RANGES[pos]
+    return time_estimate if power <= max_power else "Unknown"
+
+
+# Leading fields of every station dict, in the order of ChargingStationDataService._station_records
+_STATION_KEYS = ('name', 'address', 'suburb', 'power', 'cost', 'points')
+
 
 class ChargingStationDataService:
     """Service for accessing charging station data from datasets"""
 
     def __init__(self):
         self.charger_data = None
-        self.coordinates_data = None
+        self._cached_location_lookup = lru_cache(
+            maxsize=LOCATION_CONFIG['COORDINATE_CACHE_SIZE'])(self._lookup_location_coordinates)
+        # TTL caches, oldest entry first; lookups run in worker threads, so all access holds the lock
+        self._stations_cache_lock = threading.Lock()
+        self._route_stations_cache: 'OrderedDict[Tuple[Any, Any], Tuple[float, List[Dict[str, Any]]]]' = OrderedDict()
+        self._emergency_stations_cache: 'OrderedDict[Tuple[float, ...], Tuple[float, List[Dict[str, Any]]]]' = OrderedDict()
+        self._preference_stations_cache: 'OrderedDict[Tuple[Any, str, int], Tuple[float, List[Dict[str, Any]]]]' = OrderedDict()
         self._load_datasets()
 
     def _load_datasets(self):
@@ -47,82 +172,142 @@ class ChargingStationDataService:
 
             # Load charger information dataset - PRIMARY DATA SOURCE
             charger_path = os.path.join(
-                data_dir, DATA_CONFIG['CHARGER_CSV_PATH'].split('/')[-1])
+                data_dir, DATA_CONFIG['CHARGER_CSV_PATH'].rsplit('/', 1)[-1])
             if os.path.exists(charger_path):
-                self.charger_data = pd.read_csv(charger_path)
+                # Only parse the columns the service reads (see DATA_CONFIG['CSV_COLUMNS'])
+                wanted = set(DATA_CONFIG['CSV_COLUMNS'].values())
+                self.charger_data = pd.read_csv(
+                    charger_path, usecols=lambda column: column in wanted, engine='c')
                 logger.info(
-                    f"Loaded {len(self.charger_data)} charging stations from dataset")
+                    "Loaded %d charging stations from dataset", len(self.charger_data))
             else:
-                logger.error(f"Charger dataset not found at {charger_path}")
+                logger.error("Charger dataset not found at %s", charger_path)
                 self.charger_data = pd.DataFrame()
 
-            # Load coordinates dataset (optional - for location lookup)
-            coords_path = os.path.join(
-                data_dir, DATA_CONFIG['COORDINATES_CSV_PATH'].split('/')[-1])
-            if os.path.exists(coords_path):
-                self.coordinates_data = pd.read_csv(coords_path)
-                logger.info(
-                    f"Loaded {len(self.coordinates_data)} suburb coordinates from dataset")
-            else:
-                logger.warning(
-                    "Coordinates dataset not found - will use charger data for coordinates")
-                self.coordinates_data = pd.DataFrame()
-
+            # Coordinates dataset loading removed (unused - locations resolve against charger data)
             # ML dataset loading removed (unused)
 
         except Exception as e:
-            logger.error(f"Error loading datasets: {e}")
+            logger.error("Error loading datasets: %s", e)
             self.charger_data = pd.DataFrame()
-            self.coordinates_data = pd.DataFrame()
+
+        self._index_station_coordinates()
+        self._index_station_columns()
+
+        # Anything memoised against the previous data is stale after a (re)load
+        self._cached_location_lookup.cache_clear()
+        with self._stations_cache_lock:
+            for cache in (self._route_stations_cache, self._emergency_stations_cache,
+                          self._preference_stations_cache):
+                cache.clear()
+
+    def _index_station_columns(self):
+        """Snapshot the columns station dicts are built from as plain lists of native values"""
+        def column(key: str, default: Any) -> List[Any]:
+            name = DATA_CONFIG['CSV_COLUMNS'][key]
+            if name not in self.charger_data:
+                return [default] * len(self.charger_data)
+            return self.charger_data[name].tolist()
+
+        self._station_names = column('CHARGER_NAME', 'Unknown')
+        self._station_addresses = column('ADDRESS', 'Address not available')
+        self._station_suburbs = column('SUBURB', 'Unknown')
+        self._station_powers = column('POWER_KW', 'Power not available')
+        self._station_costs = column('USAGE_COST', 'Cost not available')
+        self._station_points = column('NUMBER_OF_POINTS', 'Points not available')
+        self._station_connections = column('CONNECTION_TYPES', '')
+        # Per-row tuples matching _STATION_KEYS so result dicts are built with a single zip
+        self._station_records = list(zip(
+            self._station_names, self._station_addresses, self._station_suburbs,
+            self._station_powers, self._station_costs, self._station_points))
+
+        # Lowercased text columns for name lookups and the geocoder, built once instead of per call
+        def lower_column(key: str) -> List[str]:
+            name = DATA_CONFIG['CSV_COLUMNS'][key]
+            if name not in self.charger_data:
+                return [''] * len(self.charger_data)
+            return self.charger_data[name].astype(str).str.lower().tolist()
+
+        self._station_names_lower = lower_column('CHARGER_NAME')
+        self._station_addresses_lower = lower_column('ADDRESS')
+        self._station_suburbs_lower = lower_column('SUBURB')
+        self._location_candidates = sorted({
+            value
+            for key in ('CHARGER_NAME', 'ADDRESS', 'SUBURB')
+            if DATA_CONFIG['CSV_COLUMNS'][key] in self.charger_data
+            for value in self.charger_data[DATA_CONFIG['CSV_COLUMNS'][key]].dropna().astype(str).str.lower()
+        })
+
+    def _index_station_coordinates(self):
+        """Cache station coordinates as radian arrays so radius searches are one vectorised pass"""
+        def column(key: str) -> np.ndarray:
+            name = DATA_CONFIG['CSV_COLUMNS'][key]
+            if name not in self.charger_data:
+                return np.zeros(len(self.charger_data))
+            return pd.to_numeric(self.charger_data[name], errors='coerce').to_numpy(dtype=np.float64)
+
+        lat, lon = column('LATITUDE'), column('LONGITUDE')
+        # Rows with a missing or zero coordinate are never returned
+        self._station_valid = (lat != 0) & (lon != 0) & ~np.isnan(lat) & ~np.isnan(lon)
+        self._station_lats, self._station_lons = lat.tolist(), lon.tolist()
+        self._station_lat_rad = np.radians(lat)
+        self._station_lon_rad = np.radians(lon)
+        self._station_cos_lat = np.cos(self._station_lat_rad)
+
+        # Optional spatial index over unit-sphere points; radius searches then visit only nearby rows
+        self._station_tree = None
+        self._station_tree_rows = np.flatnonzero(self._station_valid)
+        if cKDTree is not None and len(self._station_tree_rows) >= SEARCH_CONFIG['SPATIAL_INDEX_MIN_STATIONS']:
+            lat_rad = self._station_lat_rad[self._station_tree_rows]
+            lon_rad = self._station_lon_rad[self._station_tree_rows]
+            cos_lat = self._station_cos_lat[self._station_tree_rows]
+            self._station_tree = cKDTree(np.column_stack(
+                (cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad))))
+
+    def _rows_within_radius(self, lat: float, lon: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Dataset row indices (in file order) of stations within radius_km, and their distances"""
+        rows = self._station_tree_rows
+        if self._station_tree is not None:
+            # Straight-line chord matching the arc length, padded so rounding never drops a row
+            chord = 2.0 * sin(min(radius_km / (2.0 * _EARTH_RADIUS_KM), pi / 2)) + 1e-9
+            lat1, lon1 = radians(lat), radians(lon)
+            hits = self._station_tree.query_ball_point(
+                (cos(lat1) * cos(lon1), cos(lat1) * sin(lon1), sin(lat1)), chord)
+            rows = np.sort(rows[np.asarray(hits, dtype=np.intp)])
+        distances = _haversine_km_to_many(
+            lat, lon, self._station_lat_rad[rows], self._station_lon_rad[rows], self._station_cos_lat[rows])
+        within = distances <= radius_km
+        return rows[within], distances[within]
 
     # Removed get_stations_by_suburb (unused)
 
-    def get_nearby_stations(self, location: Tuple[float, float], radius_km: float = None) -> List[Dict[str, Any]]:
-        """Get charging stations within specified radius of location"""
+    def get_nearby_stations(self, location: Tuple[float, float], radius_km: float = None,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get charging stations within specified radius of location, nearest first (at most `limit`)"""
         if radius_km is None:
             radius_km = SEARCH_CONFIG['DEFAULT_RADIUS_KM']
         if self.charger_data.empty:
             return []
 
         user_lat, user_lon = location
-        nearby_stations = []
+        within, distances = self._rows_within_radius(user_lat, user_lon, radius_km)
+        rows = list(zip((round(d, 2) for d in distances.tolist()), within.tolist()))
 
-        for _, station in self.charger_data.iterrows():
-            try:
-                station_lat = float(station.get(
-                    DATA_CONFIG['CSV_COLUMNS']['LATITUDE'], 0))
-                station_lon = float(station.get(
-                    DATA_CONFIG['CSV_COLUMNS']['LONGITUDE'], 0))
-
-                if station_lat == 0 or station_lon == 0:
-                    continue
-
-                distance = self._calculate_distance(
-                    (user_lat, user_lon),
-                    (station_lat, station_lon)
-                )
-
-                if distance <= radius_km:
-                    station_info = {
-                        'name': station.get(DATA_CONFIG['CSV_COLUMNS']['CHARGER_NAME'], 'Unknown'),
-                        'address': station.get(DATA_CONFIG['CSV_COLUMNS']['ADDRESS'], 'Address not available'),
-                        'suburb': station.get(DATA_CONFIG['CSV_COLUMNS']['SUBURB'], 'Unknown'),
-                        'power': station.get(DATA_CONFIG['CSV_COLUMNS']['POWER_KW'], 'Power not available'),
-                        'cost': station.get(DATA_CONFIG['CSV_COLUMNS']['USAGE_COST'], 'Cost not available'),
-                        'points': station.get(DATA_CONFIG['CSV_COLUMNS']['NUMBER_OF_POINTS'], 'Points not available'),
-                        'connection_types': station.get(DATA_CONFIG['CSV_COLUMNS']['CONNECTION_TYPES'], ''),
-                        'latitude': station_lat,
-                        'longitude': station_lon,
-                        'distance_km': round(distance, 2)
-                    }
-                    nearby_stations.append(station_info)
-
-            except (ValueError, TypeError):
-                continue
-
-        # Sort by distance
-        nearby_stations.sort(key=lambda x: x['distance_km'])
-        return nearby_stations
+        # Sort by distance; nsmallest matches sorted()[:limit], ties keeping file order
+        if limit is None:
+            rows.sort(key=itemgetter(0))
+        else:
+            rows = heapq.nsmallest(limit, rows, key=itemgetter(0))
+
+        # Only the returned rows are materialised
+        return [
+            dict(zip(_STATION_KEYS, self._station_records[i]),
+                 connection_types=self._station_connections[i],
+                 latitude=self._station_lats[i],
+                 longitude=self._station_lons[i],
+                 distance_km=distance)
+            for distance, i in rows
+        ]
 
     def get_stations_by_preference(self, location: Tuple[float, float], preference: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Get stations based on preference (cheapest, fastest, closest) within preference radius.
@@ -132,9 +317,21 @@ class ChargingStationDataService:
         2) If real-time routing available, compute road distance per candidate and keep <= PREFERENCE_RADIUS_KM.
            Fallback to straight-line distance if routing is unavailable.
         3) Sort the filtered set by the selected preference and return top N.
+
+        Results are reused for PREFERENCE_STATIONS_CACHE_DURATION seconds, so the
+        selection turn ranks against the same list that was shown to the user.
         """
         if self.charger_data.empty:
             return []
+        try:
+            key = (self._location_cache_key(location), preference, limit)
+        except (TypeError, ValueError):
+            return self._find_stations_by_preference(location, preference, limit)
+        return self._cached_stations(
+            self._preference_stations_cache, key, CACHE_CONFIG['PREFERENCE_STATIONS_CACHE_DURATION'],
+            lambda: self._find_stations_by_preference(location, preference, limit))
+
+    def _find_stations_by_preference(self, location: Tuple[float, float], preference: str, limit: int) -> List[Dict[str, Any]]:
 
         preference_radius = SEARCH_CONFIG.get('PREFERENCE_RADIUS_KM', 10.0)
         prefilter_radius = SEARCH_CONFIG.get(
@@ -144,20 +341,20 @@ class ChargingStationDataService:
         prefiltered = self.get_nearby_stations(
             location, radius_km=prefilter_radius)
 
-        # Step 2: Apply road distance filter using TomTom when available
+        # Step 2: Apply road distance filter using TomTom when available.
+        # Lookups are independent network calls, so run a bounded number concurrently.
+        # The workers share one ApiManager (resolved here, before the fan-out, so they
+        # can't each construct one) and rely on its route cache being lock-guarded.
+        road_distances: List[Optional[float]] = [None] * len(prefiltered)
+        if REAL_TIME_AVAILABLE and prefiltered:
+            api_manager = get_api_manager()
+            workers = min(SEARCH_CONFIG.get('ROUTING_CONCURRENCY', 8), len(prefiltered))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                road_distances = list(pool.map(
+                    lambda s: self._road_distance_km(api_manager, location, s), prefiltered))
+
         filtered: List[Dict[str, Any]] = []
-        for station in prefiltered:
-            station_coords = (station.get('latitude'),
-                              station.get('longitude'))
-            road_distance_km: Optional[float] = None
-            if REAL_TIME_AVAILABLE and api_manager is not None:
-                try:
-                    route = api_manager.get_real_time_route(
-                        location, station_coords)  # type: ignore
-                    if route and route.get('source') == 'tomtom':
-                        road_distance_km = float(route.get('distance_km', 0))
-                except Exception:
-                    road_distance_km = None
+        for station, road_distance_km in zip(prefiltered, road_distances):
             # Fallback to straight-line
             if road_distance_km is None:
                 road_distance_km = float(station.get('distance_km', 9999))
@@ -171,54 +368,72 @@ class ChargingStationDataService:
         if not candidates:
             return []
 
-        if preference == "closest":
-            candidates.sort(key=lambda s: s.get('distance_km', 9999))
-            return candidates[:limit]
-
-        elif preference == "cheapest":
-            # Sort by cost (extract numeric value from Usage Cost column)
-            def extract_cost(station):
-                cost_str = str(station.get('cost', '0'))
-                try:
-                    # Extract first number from cost string (e.g., "AUD 0.30 per kWh" -> 0.30)
-                    numbers = re.findall(r'\d+\.?\d*', cost_str)
-                    if numbers:
-                        return float(numbers[0])
-                    # Handle "Free" case
-                    if 'free' in cost_str.lower():
-                        return 0.0
-                    return 999.0  # High cost for unknown
-                except:
-                    return 999.0
-
-            sorted_stations = sorted(candidates, key=extract_cost)
-            return sorted_stations[:limit]
-
-        elif preference == "fastest":
-            # Sort by power (higher power = faster charging)
-            def extract_power(station):
-                power_str = str(station.get('power', '0'))
-                try:
-                    # Extract first number from power string (e.g., "75, 22" -> 75)
-                    numbers = re.findall(r'\d+\.?\d*', power_str)
-                    if numbers:
-                        return float(numbers[0])
-                    return 0.0
-                except:
-                    return 0.0
-
-            sorted_stations = sorted(
-                candidates, key=extract_power, reverse=True)
-            return sorted_stations[:limit]
+        sort_key, descending = _PREFERENCE_SORT.get(preference, (_station_distance, False))
+        # Only the top `limit` are needed; nsmallest/nlargest match a stable sorted()[:limit]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(limit, candidates, key=sort_key)
 
-        else:
-            candidates.sort(key=lambda s: s.get('distance_km', 9999))
-            return candidates[:limit]
+    @staticmethod
+    def _road_distance_km(api_manager, location: Tuple[float, float], station: Dict[str, Any]) -> Optional[float]:
+        """TomTom road distance from location to a station, or None if unavailable"""
+        station_coords = (station.get('latitude'), station.get('longitude'))
+        try:
+            route = api_manager.get_real_time_route(
+                location, station_coords)  # type: ignore
+            if route and route.get('source') == 'tomtom':
+                return float(route.get('distance_km', 0))
+        except Exception:
+            # Falls back to straight-line distance; keep the cause for debugging
+            logger.debug("Road distance unavailable for %s", station.get('name'), exc_info=True)
+        return None
+
+    @staticmethod
+    def _location_cache_key(location) -> Any:
+        if isinstance(location, (tuple, list)):
+            return tuple(round(float(v), 4) for v in location)
+        return str(location).lower().strip()
 
     def get_route_stations(self, start_location: str, end_location: str) -> List[Dict[str, Any]]:
-        """Get charging stations along a route between two locations with real-time integration"""
+        """Get charging stations along a route between two locations with real-time integration
+
+        Results are reused for ROUTE_STATIONS_CACHE_DURATION seconds, since the
+        station-selection and follow-up turns re-request the route from slots.
+        """
+        try:
+            key = (self._location_cache_key(start_location), self._location_cache_key(end_location))
+        except (TypeError, ValueError):
+            return self._find_route_stations(start_location, end_location)
+
+        return self._cached_stations(
+            self._route_stations_cache, key, CACHE_CONFIG['ROUTE_STATIONS_CACHE_DURATION'],
+            lambda: self._find_route_stations(start_location, end_location))
+
+    def _cached_stations(self, cache: 'OrderedDict[Any, Tuple[float, List[Dict[str, Any]]]]', key: Any,
+                         ttl: float, compute) -> List[Dict[str, Any]]:
+        """Return a fresh list from cache[key] if unexpired, else compute and store it.
+
+        compute() runs outside the lock. Each cache has a single TTL, so its oldest
+        entries are the expired ones; they are evicted on store, along with the oldest
+        live ones once MAX_CACHED_RESULTS is reached.
+        """
+        with self._stations_cache_lock:
+            hit = cache.get(key)
+        if hit and hit[0] > time.monotonic():
+            return list(hit[1])
+
+        stations = compute()
+        now = time.monotonic()
+        with self._stations_cache_lock:
+            cache.pop(key, None)
+            while cache and (len(cache) >= CACHE_CONFIG['MAX_CACHED_RESULTS']
+                             or next(iter(cache.values()))[0] <= now):
+                cache.popitem(last=False)
+            cache[key] = (now + ttl, stations)
+        return list(stations)
+
+    def _find_route_stations(self, start_location, end_location: str) -> List[Dict[str, Any]]:
         logger.info(
-            f"Planning route from '{start_location}' to '{end_location}'")
+            "Planning route from '%s' to '%s'", start_location, end_location)
 
         # Get coordinates for both locations
         start_coords = self._get_location_coordinates(start_location)
@@ -226,50 +441,49 @@ class ChargingStationDataService:
 
         if not start_coords:
             logger.error(
-                f"Could not find coordinates for start location: {start_location}")
+                "Could not find coordinates for start location: %s", start_location)
             return []
 
         if not end_coords:
             logger.error(
-                f"Could not find coordinates for end location: {end_location}")
+                "Could not find coordinates for end location: %s", end_location)
             return []
 
         logger.info(
-            f"Route coordinates: {start_location} ({start_coords}) -> {end_location} ({end_coords})")
+            "Route coordinates: %s (%s) -> %s (%s)", start_location, start_coords, end_location, end_coords)
 
         # Get real-time route information if available
         route_info = None
         if REAL_TIME_AVAILABLE:
             try:
-                route_info = api_manager.get_real_time_route(
+                route_info = get_api_manager().get_real_time_route(
                     start_coords, end_coords)
                 if isinstance(route_info, dict):
                     instructions = route_info.get('instructions') or []
                     logger.info(
-                        f"Real-time route data: distance_km={route_info.get('distance_km')} "
-                        f"duration_min={route_info.get('duration_minutes')} "
-                        f"delay_min={route_info.get('traffic_delay_minutes')} "
-                        f"instructions_count={len(instructions)}"
+                        "Real-time route data: distance_km=%s duration_min=%s delay_min=%s instructions_count=%d",
+                        route_info.get('distance_km'), route_info.get('duration_minutes'),
+                        route_info.get('traffic_delay_minutes'), len(instructions)
                     )
                 else:
                     logger.info("Real-time route data received")
             except Exception as e:
-                logger.warning(f"Real-time route data unavailable: {e}")
+                logger.warning("Real-time route data unavailable: %s", e)
 
         # Calculate route distance (use real-time data if available, otherwise calculate)
         if route_info and route_info.get('source') == 'tomtom':
             route_distance = route_info.get('distance_km', 0)
-            logger.info(f"Real-time route distance: {route_distance:.1f} km")
+            logger.info("Real-time route distance: %.1f km", route_distance)
         else:
             route_distance = self._calculate_distance(start_coords, end_coords)
-            logger.info(f"Calculated route distance: {route_distance:.1f} km")
+            logger.info("Calculated route distance: %.1f km", route_distance)
 
         # Get stations along the route using enhanced logic
         route_stations = self._get_stations_along_route(
             start_coords, end_coords, route_distance, route_info)
 
         if route_stations:
-            logger.info(f"Found {len(route_stations)} stations along route")
+            logger.info("Found %d stations along route", len(route_stations))
             # Enhance station data with real-time information
             if REAL_TIME_AVAILABLE:
                 route_stations = self._enhance_stations_with_real_time_data(
@@ -293,7 +507,7 @@ class ChargingStationDataService:
                         station['distance_from_end'] = self._calculate_distance(
                             station_coords, end_coords)
                 logger.info(
-                    f"Fallback returned {len(nearby_destination)} stations near destination")
+                    "Fallback returned %d stations near destination", len(nearby_destination))
                 return nearby_destination[:SEARCH_CONFIG['MAX_RESULTS']]
             logger.warning("No stations found in destination-nearby fallback")
             return []
@@ -311,7 +525,7 @@ class ChargingStationDataService:
         search_radius = max(5.0, min(route_distance * 0.3,
                             SEARCH_CONFIG['ROUTE_RADIUS_KM']))
         logger.info(
-            f"Route distance={route_distance:.2f} km, search_radius={search_radius:.2f} km")
+            "Route distance=%.2f km, search_radius=%.2f km", route_distance, search_radius)
 
         # Require real-time polyline to define true route corridor
         polyline: Optional[List[Tuple[float, float]]] = None
@@ -332,40 +546,25 @@ class ChargingStationDataService:
             polyline = [start_coords, end_coords]
 
         # Get all stations within the search area
+        # (rows with missing or zero coordinates are already excluded from _station_tree_rows)
         all_stations = []
-        for _, station in self.charger_data.iterrows():
-            try:
-                station_lat = float(station.get(
-                    DATA_CONFIG['CSV_COLUMNS']['LATITUDE'], 0))
-                station_lon = float(station.get(
-                    DATA_CONFIG['CSV_COLUMNS']['LONGITUDE'], 0))
-
-                if station_lat != 0 and station_lon != 0:
-                    station_coords = (station_lat, station_lon)
-
-                    # Check if station is within search radius of the route
-                    # Use minimum perpendicular distance to any segment of the polyline
-                    min_perp = self._min_perpendicular_distance_to_polyline(
-                        polyline, station_coords)
-                    if min_perp is not None and min_perp <= search_radius:
-                        station_info = {
-                            'name': station.get(DATA_CONFIG['CSV_COLUMNS']['CHARGER_NAME'], 'Unknown'),
-                            'address': station.get(DATA_CONFIG['CSV_COLUMNS']['ADDRESS'], 'Address not available'),
-                            'suburb': station.get(DATA_CONFIG['CSV_COLUMNS']['SUBURB'], 'Unknown'),
-                            'power': station.get(DATA_CONFIG['CSV_COLUMNS']['POWER_KW'], 'Power not available'),
-                            'cost': station.get(DATA_CONFIG['CSV_COLUMNS']['USAGE_COST'], 'Cost not available'),
-                            'points': station.get(DATA_CONFIG['CSV_COLUMNS']['NUMBER_OF_POINTS'], 'Points not available'),
-                            'latitude': station_lat,
-                            'longitude': station_lon,
-                            'distance_from_start': self._calculate_distance(start_coords, station_coords),
-                            'distance_from_end': self._calculate_distance(station_coords, end_coords)
-                        }
-                        all_stations.append(station_info)
-            except (ValueError, TypeError):
-                continue
+        for i in self._station_tree_rows.tolist():
+            station_coords = (self._station_lats[i], self._station_lons[i])
+
+            # Check if station is within search radius of the route
+            # Use minimum perpendicular distance to any segment of the polyline
+            min_perp = self._min_perpendicular_distance_to_polyline(
+                polyline, station_coords)
+            if min_perp is not None and min_perp <= search_radius:
+                all_stations.append(dict(
+                    zip(_STATION_KEYS, self._station_records[i]),
+                    latitude=station_coords[0],
+                    longitude=station_coords[1],
+                    distance_from_start=self._calculate_distance(start_coords, station_coords),
+                    distance_from_end=self._calculate_distance(station_coords, end_coords)))
 
         logger.info(
-            f"Candidate stations within route corridor: {len(all_stations)}")
+            "Candidate stations within route corridor: %d", len(all_stations))
 
         if not all_stations:
             return []
@@ -388,7 +587,6 @@ class ChargingStationDataService:
         if not polyline or len(polyline) < 2:
             return None
         try:
-            from math import radians, cos, sqrt
             R = LOCATION_CONFIG['EARTH_RADIUS_KM']
             px, py = point
             pxr, pyr = radians(px), radians(py)
@@ -453,7 +651,7 @@ class ChargingStationDataService:
                 station_coords = (station.get('latitude'),
                                   station.get('longitude'))
                 if station_coords != start_coords:
-                    traffic_info = api_manager.get_real_time_traffic(
+                    traffic_info = get_api_manager().get_real_time_traffic(
                         start_coords, station_coords)
                     if traffic_info and traffic_info.get('source') == 'tomtom':
                         station = {**station,
@@ -487,54 +685,48 @@ class ChargingStationDataService:
         """Get emergency charging stations near a location"""
         coords = self._get_location_coordinates(location)
         if coords:
-            return self.get_nearby_stations(coords, radius_km=SEARCH_CONFIG['EMERGENCY_RADIUS_KM'])[:SEARCH_CONFIG['EMERGENCY_MAX_RESULTS']]
+            return self.get_emergency_stations_from_coordinates(coords)
         return []
 
     def get_emergency_stations_from_coordinates(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
         """Get emergency charging stations near coordinates"""
-        if coordinates:
-            return self.get_nearby_stations(coordinates, radius_km=SEARCH_CONFIG['EMERGENCY_RADIUS_KM'])[:SEARCH_CONFIG['EMERGENCY_MAX_RESULTS']]
-        return []
+        if not coordinates:
+            return []
+        try:
+            key = self._location_cache_key(coordinates)
+        except (TypeError, ValueError):
+            return self._find_emergency_stations(coordinates)
+        return self._cached_stations(
+            self._emergency_stations_cache, key, CACHE_CONFIG['EMERGENCY_STATIONS_CACHE_DURATION'],
+            lambda: self._find_emergency_stations(coordinates))
+
+    def _find_emergency_stations(self, coordinates: Tuple[float, float]) -> List[Dict[str, Any]]:
+        return self.get_nearby_stations(coordinates, radius_km=SEARCH_CONFIG['EMERGENCY_RADIUS_KM'],
+                                        limit=SEARCH_CONFIG['EMERGENCY_MAX_RESULTS'])
 
     def get_station_details(self, station_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific station"""
         if self.charger_data.empty:
             return None
 
-        # Search by name (case insensitive)
-        mask = self.charger_data[DATA_CONFIG['CSV_COLUMNS']['CHARGER_NAME']].str.lower().str.contains(
-            station_name.lower(), na=False
-        )
-        station = self.charger_data[mask]
-
-        if station.empty:
+        # Search by name (case insensitive, plain substring so "[Evie]" or "(LG)" match literally)
+        needle = station_name.lower()
+        i = next((i for i, name in enumerate(self._station_names_lower) if needle in name), None)
+        if i is None:
             return None
 
-        station = station.iloc[0]
-
         # Calculate estimated charging time based on power from CSV
-        power_str = str(station.get(
-            DATA_CONFIG['CSV_COLUMNS']['POWER_KW'], '22'))
-        try:
-            numbers = re.findall(r'\d+\.?\d*', power_str)
-            power = float(numbers[0]) if numbers else 22.0
-        except:
-            power = 22.0
-
-        # Use configuration-based charging time estimates
-        charging_time = "Unknown"
-        for power_range, (min_power, max_power, time_estimate) in CHARGING_CONFIG['CHARGING_TIME_ESTIMATES'].items():
-            if min_power <= power <= max_power:
-                charging_time = time_estimate
-                break
+        power_str = str(self._station_powers[i])
+        match = _NUMBER_RE.search(power_str)
+        power = float(match.group()) if match else 22.0
 
         return {
-            'name': station.get(DATA_CONFIG['CSV_COLUMNS']['CHARGER_NAME'], 'Unknown'),
-            'address': station.get(DATA_CONFIG['CSV_COLUMNS']['ADDRESS'], 'Address not available'),
+            'name': self._station_names[i],
+            'address': self._station_addresses[i],
             'power': f"{power}kW",
-            'points': f"{station.get(DATA_CONFIG['CSV_COLUMNS']['NUMBER_OF_POINTS'], 'Unknown')} points",
-            'cost': station.get(DATA_CONFIG['CSV_COLUMNS']['USAGE_COST'], 'Cost not available'),
-            'charging_time': charging_time,
+            'points': f"{self._station_points[i]} points",
+            'cost': self._station_costs[i],
+            'charging_time': _charging_time_estimate(power),
             'trip_time': "Calculating..."
         }
 
@@ -548,7 +740,7 @@ class ChargingStationDataService:
             try:
                 lat, lng = float(location_input[0]), float(location_input[1])
                 if lat != 0 and lng != 0:
-                    logger.info(f"Using provided coordinates: ({lat}, {lng})")
+                    logger.info("Using provided coordinates: (%s, %s)", lat, lng)
                     return (lat, lng)
             except (ValueError, TypeError):
                 pass
@@ -559,110 +751,40 @@ class ChargingStationDataService:
         else:
             return None
 
-        # Direct lookups against charger_info_mel.csv
-        try:
-            if self.charger_data is None or self.charger_data.empty:
-                return None
-
-            name_col = DATA_CONFIG['CSV_COLUMNS']['CHARGER_NAME']
-            addr_col = DATA_CONFIG['CSV_COLUMNS']['ADDRESS']
-            suburb_col = DATA_CONFIG['CSV_COLUMNS']['SUBURB']
-            lat_col = DATA_CONFIG['CSV_COLUMNS']['LATITUDE']
-            lon_col = DATA_CONFIG['CSV_COLUMNS']['LONGITUDE']
-
-            # 1) Exact/contains match by suburb (checked first — users type suburbs, not station names)
-            try:
-                sub_lower = self.charger_data[suburb_col].astype(str).str.lower()
-                mask = (sub_lower == location_clean) | sub_lower.str.contains(location_clean, na=False)
-                rows = self.charger_data[mask]
-                if not rows.empty:
-                    row = rows.iloc[0]
-                    lat = float(row.get(lat_col, 0))
-                    lon = float(row.get(lon_col, 0))
-                    if lat != 0 and lon != 0:
-                        logger.info(f"Found coordinates from suburb: '{row.get(suburb_col)}' → ({lat}, {lon})")
-                        return (lat, lon)
-            except Exception:
-                pass
+        # The dataset is static, so lookups (including misses) are memoized per normalized name
+        return self._cached_location_lookup(location_clean)
 
-            # 2) Contains match by address
-            try:
-                mask = self.charger_data[addr_col].astype(str).str.lower().str.contains(location_clean, na=False)
-                rows = self.charger_data[mask]
-                if not rows.empty:
-                    row = rows.iloc[0]
-                    lat = float(row.get(lat_col, 0))
-                    lon = float(row.get(lon_col, 0))
-                    if lat != 0 and lon != 0:
-                        logger.info(f"Found coordinates from address: '{row.get(addr_col)}' → ({lat}, {lon})")
-                        return (lat, lon)
-            except Exception:
-                pass
-
-            # 3) Exact/contains match by station name (last resort)
-            try:
-                mask = self.charger_data[name_col].astype(str).str.lower().str.contains(location_clean, na=False)
-                rows = self.charger_data[mask]
-                if not rows.empty:
-                    row = rows.iloc[0]
-                    lat = float(row.get(lat_col, 0))
-                    lon = float(row.get(lon_col, 0))
-                    if lat != 0 and lon != 0:
-                        logger.info(f"Found coordinates from station name: '{row.get(name_col)}' → ({lat}, {lon})")
-                        return (lat, lon)
-            except Exception:
-                pass
+    def _lookup_location_coordinates(self, location_clean: str) -> Optional[Tuple[float, float]]:
+        """Resolve a normalized location string against charger_info_mel.csv."""
+        if self.charger_data is None or self.charger_data.empty:
+            return None
 
-            # 4) Fuzzy match against combined candidates (name, address, suburb) within charger_data
-            try:
-                candidates = []
-                try:
-                    candidates.extend(self.charger_data[name_col].dropna().astype(
-                        str).str.lower().tolist())
-                except Exception:
-                    pass
-                try:
-                    candidates.extend(self.charger_data[addr_col].dropna().astype(
-                        str).str.lower().tolist())
-                except Exception:
-                    pass
-                try:
-                    candidates.extend(self.charger_data[suburb_col].dropna().astype(
-                        str).str.lower().tolist())
-                except Exception:
-                    pass
-
-                import difflib as _difflib
-                best = _difflib.get_close_matches(
-                    location_clean, list(set(candidates)), n=1, cutoff=0.6)
-                if best:
-                    best_str = best[0]
-                    mask = (
-                        self.charger_data[name_col].astype(
-                            str).str.lower() == best_str
-                    ) | (
-                        self.charger_data[addr_col].astype(
-                            str).str.lower() == best_str
-                    ) | (
-                        self.charger_data[suburb_col].astype(
-                            str).str.lower() == best_str
-                    )
-                    rows = self.charger_data[mask]
-                    if not rows.empty:
-                        row = rows.iloc[0]
-                        lat = float(row.get(lat_col, 0))
-                        lon = float(row.get(lon_col, 0))
-                        if lat != 0 and lon != 0:
-                            logger.info(
-                                f"Fuzzy-matched '{location_clean}' → '{best_str}' → ({lat}, {lon})")
-                            return (lat, lon)
-            except Exception:
-                pass
-        except Exception:
-            pass
+        # Suburb first (users type suburbs, not station names), then address, then station name
+        for label, values, lowered in (
+                ('suburb', self._station_suburbs, self._station_suburbs_lower),
+                ('address', self._station_addresses, self._station_addresses_lower),
+                ('station name', self._station_names, self._station_names_lower)):
+            i = next((i for i, value in enumerate(lowered) if location_clean in value), None)
+            if i is not None and self._station_lats[i] != 0 and self._station_lons[i] != 0:
+                logger.info("Found coordinates from %s: '%s' → (%s, %s)",
+                            label, values[i], self._station_lats[i], self._station_lons[i])
+                return (self._station_lats[i], self._station_lons[i])
+
+        # Fuzzy match against combined candidates (name, address, suburb) within charger_data
+        best = difflib.get_close_matches(
+            location_clean, self._location_candidates, n=1, cutoff=0.6)
+        if best:
+            best_str = best[0]
+            i = next((i for i, row in enumerate(zip(self._station_names_lower, self._station_addresses_lower,
+                                                    self._station_suburbs_lower)) if best_str in row), None)
+            if i is not None and self._station_lats[i] != 0 and self._station_lons[i] != 0:
+                logger.info(
+                    "Fuzzy-matched '%s' → '%s' → (%s, %s)", location_clean, best_str,
+                    self._station_lats[i], self._station_lons[i])
+                return (self._station_lats[i], self._station_lons[i])
 
         logger.warning(
-            f"Could not find coordinates for location: '{location_input}'")
+            "Could not find coordinates for location: '%s'", location_clean)
         return None
 
     """
@@ -671,21 +793,7 @@ class ChargingStationDataService:
 
     def _calculate_distance(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
         """Calculate distance between two points using Haversine formula"""
-        lat1, lon1 = point1
-        lat2, lon2 = point2
-
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1-a))
-
-        # Use configuration for Earth's radius
-        radius = LOCATION_CONFIG['EARTH_RADIUS_KM']
-        return radius * c
+        return _haversine_km(point1[0], point1[1], point2[0], point2[1])
 
     def _get_station_availability(self, lat: float, lon: float):
         """
@@ -693,7 +801,7 @@ class ChargingStationDataService:
         Returns: (status_str, updated_at, data_dict_or_str)
         """
         try:
-            result = api_manager.get_charging_availability(lat, lon)
+            result = get_api_manager().get_charging_availability(lat, lon)
 
             if not isinstance(result, dict):
                 return "Unknown", None, "No structured availability payload returned."
@@ -716,5 +824,28 @@ class ChargingStationDataService:
             return "Unknown", None, f"Error fetching availability: {e}"
 
 
-# Global instance
-data_service = ChargingStationDataService()
+# Shared instance, created on first use so importing the actions package doesn't read the CSVs
+_data_service: Optional[ChargingStationDataService] = None
+_data_service_lock = threading.Lock()
+
+
+def get_data_service() -> ChargingStationDataService:
+    """Return the shared ChargingStationDataService, loading the datasets on first call"""
+    global _data_service
+    if _data_service is None:
+        with _data_service_lock:
+            if _data_service is None:
+                _data_service = ChargingStationDataService()
+    return _data_service
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from actions.data_service import data_service` working for older callers
+    if name == 'data_service':
+        return get_data_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Production warm-up: EVAT_PRELOAD=1 loads the datasets at import instead of on the first request
+if os.environ.get('EVAT_PRELOAD', '').lower() in ('1', 'true', 'yes'):
+    get_data_service()
@@ -1,35 +1,38 @@
 import os
 import logging
 from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime
 
 # Import real-time APIs
 try:
     import sys
     sys.path.append(os.path.join(
         os.path.dirname(__file__), '..', '..', 'backend'))
-    from real_time_apis import api_manager
+    from real_time_apis import get_api_manager
     REAL_TIME_AVAILABLE = True
     logger = logging.getLogger(__name__)
     logger.info("Real-time APIs imported successfully")
 except ImportError as e:
     REAL_TIME_AVAILABLE = False
     logger = logging.getLogger(__name__)
-    logger.warning(f"Real-time APIs not available: {e}")
+    logger.warning("Real-time APIs not available: %s", e)
 
 try:
-    from .data_service import data_service
+    from .data_service import get_data_service
 except Exception:
-    data_service = None
+    get_data_service = None
 
 
 class RealTimeIntegrationManager:
     """Manages real-time data integration for the chatbot"""
 
     def __init__(self):
-        self.api_manager = api_manager if REAL_TIME_AVAILABLE else None
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def api_manager(self):
+        """Shared TomTom client, created on first use"""
+        return get_api_manager() if REAL_TIME_AVAILABLE else None
+
     def is_available(self) -> bool:
         """Check if real-time APIs are available"""
         return REAL_TIME_AVAILABLE and self.api_manager is not None
@@ -41,14 +44,14 @@ class RealTimeIntegrationManager:
 
         try:
             # CSV dataset lookup only
-            if data_service is not None:
-                coords = data_service._get_location_coordinates(location_name)
+            if get_data_service is not None:
+                coords = get_data_service()._get_location_coordinates(location_name)
                 if coords and isinstance(coords, tuple) and len(coords) == 2:
                     return coords  # type: ignore
 
             return None
         except Exception as e:
-            self.logger.error(f"Error getting user location: {e}")
+            self.logger.error("Error getting user location: %s", e)
             return None
 
     def get_route_with_traffic(self, start_location: str, end_location: str) -> Optional[Dict[str, Any]]:
@@ -80,7 +83,7 @@ class RealTimeIntegrationManager:
             return None
 
         except Exception as e:
-            self.logger.error(f"Error getting route with traffic: {e}")
+            self.logger.error("Error getting route with traffic: %s", e)
             return None
 
     """
@@ -115,7 +118,7 @@ class RealTimeIntegrationManager:
             return None
 
         except Exception as e:
-            self.logger.error(f"Error getting traffic conditions: {e}")
+            self.logger.error("Error getting traffic conditions: %s", e)
             return None
 
     # Weather integration removed
@@ -159,7 +162,7 @@ class RealTimeIntegrationManager:
                 result['message'] = "No real-time data available"
 
         except Exception as e:
-            self.logger.error(f"Error in enhanced route planning: {e}")
+            self.logger.error("Error in enhanced route planning: %s", e)
             result['message'] = f"Error retrieving real-time data: {str(e)}"
 
         return result